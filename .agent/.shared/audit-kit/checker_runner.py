@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Checker Runner - Antigravity Kit
+================================
+Runs skill checkers inside the orchestrator's own process instead of spawning
+one Python interpreter per check.
+
+Plugin API: a checker script exposes
+
+    def run_check(project_path) -> dict
+
+which performs the check, may print its usual human-readable report, and
+returns a structured result containing at least {"passed": bool}. Its
+`main()` stays a thin CLI wrapper around it. Scripts without `run_check`
+(lighthouse, playwright - anything driving an external tool against a URL)
+keep running as a subprocess.
+
+Usage (inside an orchestrator):
+    check = load_checker(script_path)
+    if check:
+        outcome = run_in_process(check, project_path, timeout=600)   # {"passed", "output", "error", "data"}
+
+A checker that overruns its timeout raises TimeoutError in the caller, like
+subprocess.TimeoutExpired for scripts; its thread is abandoned (daemon).
+"""
+
+import importlib.util
+import hashlib
+import io
+import sys
+import threading
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+
+_MODULES = {}
+_LOAD_LOCK = threading.Lock()
+
+
+class _ThreadOutput:
+    """sys.stdout/sys.stderr stand-in that sends each thread's writes to its own buffer while capturing."""
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer if buffer is not None else self._stream).write(text)
+
+    def flush(self):
+        if getattr(self._local, "buffer", None) is None:
+            self._stream.flush()
+
+    def __getattr__(self, name):
+        return getattr(self._stream, name)
+
+
+def _install_outputs():
+    if not isinstance(sys.stdout, _ThreadOutput):
+        sys.stdout = _ThreadOutput(sys.stdout)
+    if not isinstance(sys.stderr, _ThreadOutput):
+        sys.stderr = _ThreadOutput(sys.stderr)
+
+
+@contextmanager
+def _capture():
+    """Collect everything the current thread prints; other threads keep writing to the console."""
+    _install_outputs()
+    out, err = io.StringIO(), io.StringIO()
+    sys.stdout._local.buffer = out
+    sys.stderr._local.buffer = err
+    try:
+        yield out, err
+    finally:
+        sys.stdout._local.buffer = None
+        sys.stderr._local.buffer = None
+
+
+def load_checker(script_path):
+    """Import a checker script and return its run_check callable, or None if it has no plugin entry point."""
+    script_path = Path(script_path).resolve()
+    with _LOAD_LOCK:
+        if script_path not in _MODULES:
+            name = f"_checker_{script_path.stem}_{hashlib.sha1(str(script_path).encode()).hexdigest()[:8]}"
+            try:
+                spec = importlib.util.spec_from_file_location(name, script_path)
+                module = importlib.util.module_from_spec(spec)
+                sys.modules[name] = module
+                spec.loader.exec_module(module)
+            except Exception:
+                # Unimportable here (missing optional dependency, ...): let the caller use a subprocess
+                sys.modules.pop(name, None)
+                module = None
+            _MODULES[script_path] = module
+        module = _MODULES[script_path]
+    check = getattr(module, "run_check", None)
+    return check if callable(check) else None
+
+
+def run_in_process(check, project_path, timeout=None, **kwargs) -> dict:
+    """
+    Run a loaded checker, capturing its printed report alongside the structured result.
+    With a timeout (seconds) the checker runs in a daemon thread and TimeoutError is
+    raised if it has not finished by then, so a hung checker cannot block the suite.
+    """
+    if timeout is None:
+        return _run_captured(check, project_path, **kwargs)
+    outcome = {}
+    worker = threading.Thread(target=lambda: outcome.update(_run_captured(check, project_path, **kwargs)),
+                              daemon=True)
+    worker.start()
+    worker.join(timeout)
+    if worker.is_alive():
+        raise TimeoutError(f"checker still running after {timeout}s")
+    return outcome
+
+
+def _run_captured(check, project_path, **kwargs) -> dict:
+    data = None
+    with _capture() as (out, err):
+        try:
+            data = check(str(project_path), **kwargs)
+            passed = bool(data.get("passed", False))
+        except SystemExit as e:
+            passed = e.code in (0, None)
+        except Exception:
+            traceback.print_exc()
+            passed = False
+    return {"passed": passed, "output": out.getvalue(), "error": err.getvalue(), "data": data}
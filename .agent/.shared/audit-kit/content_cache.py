@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Content Cache - Antigravity Kit
+===============================
+Reads and decodes each source file once per process and hands the same text
+to every checker that asks for it. Entries are bounded by an LRU byte budget
+(AGENT_CONTENT_CACHE_MB, default 64) and revalidated against mtime/size on
+every lookup.
+
+Text is decoded the way open(path, 'r', encoding='utf-8', errors=...) would:
+UTF-8 with universal newlines. Files that decode cleanly are stored once and
+shared by every errors= mode.
+
+FileContent.line_spans() walks a precomputed line-offset table, so a checker
+can run compiled patterns over one line with pattern.search(text, start, end)
+without slicing the line out.
+
+Guarded reads (guard=True) raise SkippedFile instead of decoding files no
+text checker should scan: binary files (NUL byte in the first 8 KB), minified
+files (average line over 500 bytes) and files above AGENT_MAX_FILE_KB
+(default 1024). guarded_chunks() streams oversized text files instead, as
+line-aligned chunks, so memory stays bounded.
+
+Usage:
+    content = read_text(path)                     # str, like Path.read_text
+    for line_num, start, end in read_content(path).line_spans():
+        if PATTERN.search(text, start, end): ...
+    for lines_before, content in guarded_chunks(path):
+        scan(content)
+"""
+
+import bisect
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+BUDGET_ENV = "AGENT_CONTENT_CACHE_MB"
+DEFAULT_BUDGET_MB = 64
+
+MAX_FILE_ENV = "AGENT_MAX_FILE_KB"
+DEFAULT_MAX_FILE_KB = 1024
+SNIFF_BYTES = 8192              # a NUL byte in here marks a binary file
+MINIFIED_SAMPLE_BYTES = 65536   # head of the file used for minified detection
+MINIFIED_MIN_BYTES = 4096       # smaller files are never treated as minified
+MINIFIED_AVG_LINE = 500
+STREAM_CHUNK_CHARS = 1024 * 1024
+
+
+class SkippedFile(OSError):
+    """Raised by guarded reads for a file that is binary, minified or oversized."""
+
+    def __init__(self, path, reason: str):
+        super().__init__(f"skipped {reason} file: {path}")
+        self.path = path
+        self.reason = reason
+
+
+class FileContent:
+    """Decoded text of one file plus a lazily built table of line start offsets."""
+
+    __slots__ = ("text", "_offsets")
+
+    def __init__(self, text: str):
+        self.text = text
+        self._offsets = None
+
+    @property
+    def line_offsets(self) -> List[int]:
+        """Start offset of every line (the same lines readlines() would return)."""
+        if self._offsets is None:
+            text = self.text
+            offsets = [0] if text else []
+            find = text.find
+            pos = find("\n")
+            while pos != -1 and pos + 1 < len(text):
+                offsets.append(pos + 1)
+                pos = find("\n", pos + 1)
+            self._offsets = offsets
+        return self._offsets
+
+    def line_spans(self) -> Iterator[Tuple[int, int, int]]:
+        """(line_num, start, end) per line; end includes the trailing newline, as readlines() does."""
+        offsets = self.line_offsets
+        ends = offsets[1:] + [len(self.text)]
+        return zip(range(1, len(offsets) + 1), offsets, ends)
+
+    def line_span(self, line_num: int) -> Tuple[int, int]:
+        """(start, end) offsets of one line (1-based), newline included."""
+        offsets = self.line_offsets
+        end = offsets[line_num] if line_num < len(offsets) else len(self.text)
+        return offsets[line_num - 1], end
+
+    def line(self, line_num: int) -> str:
+        """One line (1-based) including its newline."""
+        start, end = self.line_span(line_num)
+        return self.text[start:end]
+
+    def line_number(self, pos: int) -> int:
+        """1-based line containing text offset pos."""
+        return bisect.bisect_right(self.line_offsets, pos)
+
+    def lines(self) -> List[str]:
+        """Materialized readlines() equivalent, for callers that need real strings."""
+        return [self.text[start:end] for _, start, end in self.line_spans()]
+
+
+def sniff(head: bytes, size: int, max_file_bytes: int) -> Optional[str]:
+    """Why a file should not be scanned as text ('binary', 'minified', 'oversized'), or None."""
+    if b"\0" in head[:SNIFF_BYTES]:
+        return "binary"
+    if size >= MINIFIED_MIN_BYTES:
+        sample = head[:MINIFIED_SAMPLE_BYTES]
+        if len(sample) / (sample.count(b"\n") + 1) > MINIFIED_AVG_LINE:
+            return "minified"
+    if size > max_file_bytes:
+        return "oversized"
+    return None
+
+
+def _decode(raw: bytes, errors: str) -> Tuple[str, bool]:
+    try:
+        text, clean = raw.decode("utf-8"), True
+    except UnicodeDecodeError:
+        text, clean = raw.decode("utf-8", errors), False
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
+    return text, clean
+
+
+class ContentCache:
+    """Thread-safe LRU of decoded files, bounded by the total size of the files held."""
+
+    def __init__(self, max_bytes: int, max_file_bytes: int = DEFAULT_MAX_FILE_KB * 1024):
+        self.max_bytes = max_bytes
+        self.max_file_bytes = max_file_bytes
+        self.used = 0
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()   # path -> (signature, size, {errors|None: FileContent}, verdict)
+        self._lock = threading.Lock()
+
+    def get(self, path, errors: str = "ignore", guard: bool = False) -> FileContent:
+        """Decoded content of path; raises OSError like open() would (SkippedFile when guarded)."""
+        key = os.path.abspath(path)
+        st = os.stat(key)
+        signature = (st.st_mtime_ns, st.st_size)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == signature:
+                variants, verdict = entry[2], entry[3]
+                content = variants.get(None) or variants.get(errors)
+                if (guard and verdict) or content is not None:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    if guard and verdict:
+                        raise SkippedFile(key, verdict)
+                    return content
+
+        if guard and st.st_size > self.max_file_bytes:
+            # Sniff the head only; oversized files are never read whole when guarded
+            with open(key, "rb") as f:
+                verdict = sniff(f.read(MINIFIED_SAMPLE_BYTES), st.st_size, self.max_file_bytes)
+            self._store(key, signature, 0, None, verdict)
+            raise SkippedFile(key, verdict)
+
+        raw = Path(key).read_bytes()
+        verdict = sniff(raw, len(raw), self.max_file_bytes)
+        if guard and verdict:
+            self._store(key, signature, 0, None, verdict)
+            raise SkippedFile(key, verdict)
+
+        text, clean = _decode(raw, errors)
+        content = FileContent(text)
+        self._store(key, signature, len(raw), (None if clean else errors, content), verdict)
+        return content
+
+    def _store(self, key, signature, raw_size: int, variant, verdict) -> None:
+        with self._lock:
+            self.misses += 1
+            entry = self._entries.pop(key, None)
+            if entry:
+                self.used -= entry[1]
+            variants = entry[2] if entry and entry[0] == signature else {}
+            if variant is not None:
+                variants[variant[0]] = variant[1]
+            size = raw_size * len(variants)
+            if size <= self.max_bytes:
+                self._entries[key] = (signature, size, variants, verdict)
+                self.used += size
+                while self.used > self.max_bytes:
+                    _, (_, evicted, _, _) = self._entries.popitem(last=False)
+                    self.used -= evicted
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.used = 0
+
+
+def _env_size(name: str, default: float, unit: int) -> int:
+    try:
+        return int(float(os.environ.get(name, default)) * unit)
+    except ValueError:
+        return int(default * unit)
+
+
+_SHARED = ContentCache(_env_size(BUDGET_ENV, DEFAULT_BUDGET_MB, 1024 * 1024),
+                       _env_size(MAX_FILE_ENV, DEFAULT_MAX_FILE_KB, 1024))
+
+
+def guard_salt() -> str:
+    """Guard limits in effect, for result caches whose results depend on what was skipped."""
+    return f"guard:{_SHARED.max_file_bytes}:{MINIFIED_AVG_LINE}"
+
+
+def read_content(path, errors: str = "ignore", guard: bool = False) -> FileContent:
+    """Shared, cached FileContent for path."""
+    return _SHARED.get(path, errors, guard)
+
+
+def read_text(path, errors: str = "ignore", guard: bool = False) -> str:
+    """Cached equivalent of Path(path).read_text(encoding='utf-8', errors=errors)."""
+    return _SHARED.get(path, errors, guard).text
+
+
+def stream_content(path, errors: str = "ignore",
+                   chunk_chars: int = STREAM_CHUNK_CHARS) -> Iterator[Tuple[int, FileContent]]:
+    """
+    A text file as consecutive (lines_before, FileContent) chunks ending on line
+    boundaries; a line longer than chunk_chars is split across chunks.
+    """
+    lines_before = 0
+    carry = ""
+    with open(path, "r", encoding="utf-8", errors=errors) as f:
+        while True:
+            block = f.read(chunk_chars)
+            if not block:
+                break
+            text = carry + block
+            cut = text.rfind("\n") + 1 or len(text)
+            chunk, carry = text[:cut], text[cut:]
+            yield lines_before, FileContent(chunk)
+            lines_before += chunk.count("\n")
+    if carry:
+        yield lines_before, FileContent(carry)
+
+
+def guarded_chunks(path, errors: str = "ignore") -> Iterable[Tuple[int, FileContent]]:
+    """
+    Everything a scanner should look at in path: the whole cached file as one
+    chunk, oversized text streamed in chunks, nothing for binary/minified files.
+    """
+    try:
+        return [(0, _SHARED.get(path, errors, guard=True))]
+    except SkippedFile as skipped:
+        return stream_content(path, errors) if skipped.reason == "oversized" else []
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+File Audit - Antigravity Kit
+============================
+The per-file fan-out shared by the static checkers: results still valid in
+the verify cache are replayed, the remaining files are analyzed (sharded
+across worker processes when asked) and everything comes back in file
+order, so output never depends on the worker count.
+
+cached_map() is the plain version for checkers built from functions;
+FileAuditor adds audit_directory() to auditor classes that collect
+issues/warnings/passed checks per file.
+
+Usage:
+    results = cached_map(scan_file, files, cache, jobs=4)   # scan_file must be picklable
+
+    class MyAuditor(FileAuditor):
+        CHECKER = "my_audit"
+        SCRIPT = __file__
+        EXTENSIONS = {'.tsx', '.jsx'}
+        SKIP_DIRS = {'node_modules', '.git'}
+        def audit_file(self, filepath): ...
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from content_cache import guard_salt
+from file_index import project_files
+from result_cache import FileResultCache, script_fingerprint
+
+DEFAULT_CHUNK = 8
+
+
+def cached_map(func, files, cache: FileResultCache, pool=None, jobs: int = 1,
+               chunksize: int = DEFAULT_CHUNK, reuse: bool = True) -> list:
+    """
+    func(path) for every file, returned in file order. Results cached for an
+    unchanged file are reused (unless reuse is False) and fresh ones are stored
+    back; with a pool, or jobs > 1, the remaining files run in worker processes.
+    The caller saves the cache.
+    """
+    results = [None] * len(files)
+    pending = []
+    for i, filepath in enumerate(files):
+        hit, value = cache.lookup(filepath) if reuse else (False, None)
+        if hit:
+            results[i] = value
+        else:
+            pending.append((i, value))
+
+    paths = [files[i] for i, _ in pending]
+    if len(paths) > 1 and pool is not None:
+        computed = list(pool.map(func, paths, chunksize=chunksize))
+    elif len(paths) > 1 and jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as own_pool:
+            computed = list(own_pool.map(func, paths, chunksize=chunksize))
+    else:
+        computed = [func(path) for path in paths]
+
+    for (i, token), result in zip(pending, computed):
+        cache.store(token, result)
+        results[i] = result
+    return results
+
+
+def _audit_one(auditor_class, kwargs: dict, filepath: str) -> dict:
+    """Process-pool entry point: audit one file with a fresh auditor."""
+    return auditor_class(**kwargs).audit_file_result(filepath)
+
+
+class FileAuditor:
+    """
+    Mixin for auditors with files_checked/issues/warnings/passed_count totals
+    and an audit_file(filepath) method.
+    """
+    CHECKER = ""            # verify cache name
+    SCRIPT = None           # the checker's __file__ (its source salts the cache)
+    EXTENSIONS = set()
+    SKIP_DIRS = set()
+    POOL_CHUNK = DEFAULT_CHUNK
+
+    def auditor_kwargs(self) -> dict:
+        """Constructor arguments for the fresh per-file auditors."""
+        return {}
+
+    def reuse_cached(self) -> bool:
+        """False to evaluate every file even when the verify cache has its result."""
+        return True
+
+    def file_result(self) -> dict:
+        """This auditor's findings as plain (cacheable, picklable) data."""
+        return {
+            "files_checked": self.files_checked,
+            "issues": self.issues,
+            "warnings": self.warnings,
+            "passed_checks": self.passed_count
+        }
+
+    def audit_file_result(self, filepath: str) -> dict:
+        """Audit one file in isolation and return its findings as plain data."""
+        auditor = type(self)(**self.auditor_kwargs())
+        auditor.audit_file(filepath)
+        return auditor.file_result()
+
+    def merge_file_result(self, result: dict) -> None:
+        """Fold one audit_file_result() into this auditor's totals."""
+        self.files_checked += result["files_checked"]
+        self.issues.extend(result["issues"])
+        self.warnings.extend(result["warnings"])
+        self.passed_count += result["passed_checks"]
+
+    def audit_directory(self, directory: str, jobs: int = 1) -> None:
+        """
+        Audit every matching file under directory, in path order. With jobs > 1
+        files not served by the verify cache are audited in worker processes.
+        """
+        entries = sorted(project_files(directory, suffixes=self.EXTENSIONS, skip_dirs=self.SKIP_DIRS),
+                         key=lambda e: e.rel)
+        files = [str(entry.path) for entry in entries]
+        cache = FileResultCache(self.CHECKER, directory, salt=script_fingerprint(self.SCRIPT) + guard_salt())
+        worker = partial(_audit_one, type(self), self.auditor_kwargs())
+        for result in cached_map(worker, files, cache, jobs=jobs, chunksize=self.POOL_CHUNK,
+                                 reuse=self.reuse_cached()):
+            self.merge_file_result(result)
+        cache.save()
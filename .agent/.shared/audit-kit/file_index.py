@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+File Index - Antigravity Kit
+============================
+One pruned walk of a project tree, shared by every checker running in the
+same process. Each entry carries its relative path, size, mtime and
+extension plus the directory names above it, so a checker applies its own
+skip-dir rules without walking the tree again.
+
+Directories no checker ever looks into (ALWAYS_SKIP) and directories
+matched by .gitignore/.agentignore rules (see ignore_rules.py) are pruned
+before the walk descends into them; everything else is classified, not
+skipped. Ignored files inside walked directories are kept but flagged, and
+only returned with include_ignored=True. Entries come back in os.walk order,
+which matches what Path.glob()/rglob() used to return.
+
+include_ignored=True (the secrets scan: a gitignored .env or build output
+can still leak) uses a second walk that also descends into ignored
+directories, pruning the caller's skip_dirs instead; files below an ignored
+directory are flagged ignored.
+
+Usage:
+    for entry in project_files(project_path, suffixes={'.tsx', '.jsx'}, skip_dirs=SKIP_DIRS):
+        check(entry.path)
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Tuple
+
+from ignore_rules import IGNORE_FILES, IgnoreRules, enabled as ignore_rules_enabled
+
+# Dependency trees and VCS metadata: never source files for any checker
+ALWAYS_SKIP = {'node_modules', '.git'}
+
+_INDEXES = {}
+_LOCK = threading.Lock()
+
+
+class FileEntry(NamedTuple):
+    path: Path              # project_path / rel, as passed by the caller
+    rel: str                # POSIX path relative to the project root
+    dirs: Tuple[str, ...]   # directory names between the root and the file
+    name: str
+    suffix: str             # as on disk; use .ext for case-insensitive matching
+    size: int
+    mtime_ns: int
+    ignored: bool = False   # matched by a .gitignore/.agentignore rule
+
+    @property
+    def ext(self) -> str:
+        return self.suffix.lower()
+
+    def in_dirs(self, names) -> bool:
+        """True if any directory above this file is one of names (skip-dir classification)."""
+        return any(d in names for d in self.dirs)
+
+
+def _walk(root: Path, walk_ignored: Optional[frozenset] = None) -> List[tuple]:
+    """
+    (dirs, name, size, mtime_ns, ignored) records. Ignored directories are pruned,
+    or, with walk_ignored (a set of directory names to prune instead), walked.
+    """
+    rules = IgnoreRules() if ignore_rules_enabled() else None
+    if rules is not None:
+        rules.add_file(root / ".git" / "info" / "exclude")
+    records = []
+    ignored_dirs = set()    # walked ignored directories (walk_ignored only)
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_dir = os.path.relpath(dirpath, root)
+        dirs = () if rel_dir == os.curdir else tuple(Path(rel_dir).parts)
+        prefix = "/".join(dirs)
+        inside_ignored = prefix in ignored_dirs
+        if rules is not None:
+            for ignore_file in IGNORE_FILES:
+                if ignore_file in filenames:
+                    rules.add_file(os.path.join(dirpath, ignore_file), base=prefix)
+        kept = []
+        for d in dirnames:
+            if d in ALWAYS_SKIP:
+                continue
+            path = f"{prefix}/{d}" if prefix else d
+            ignored = inside_ignored or bool(rules and rules.ignored(path, is_dir=True))
+            if walk_ignored is None:
+                if not ignored:
+                    kept.append(d)
+            elif d not in walk_ignored:
+                kept.append(d)
+                if ignored:
+                    ignored_dirs.add(path)
+        dirnames[:] = kept
+        for name in filenames:
+            try:
+                st = os.stat(os.path.join(dirpath, name))
+            except OSError:
+                continue
+            ignored = inside_ignored or bool(rules and rules.ignored(f"{prefix}/{name}" if prefix else name))
+            records.append((dirs, name, st.st_size, st.st_mtime_ns, ignored))
+    return records
+
+
+def _records(project_path, refresh: bool = False, walk_ignored: Optional[frozenset] = None) -> List[tuple]:
+    root = Path(project_path).resolve()
+    key = (root, walk_ignored)
+    with _LOCK:
+        if refresh or key not in _INDEXES:
+            _INDEXES[key] = _walk(root, walk_ignored)
+        return _INDEXES[key]
+
+
+def project_files(project_path, suffixes: Optional[Iterable[str]] = None,
+                  skip_dirs: Iterable[str] = (), refresh: bool = False,
+                  include_ignored: bool = False) -> List[FileEntry]:
+    """
+    Files under project_path from the shared index.
+    suffixes matches the on-disk suffix exactly (like glob); skip_dirs drops
+    files below any directory with one of those names; include_ignored also
+    returns files matched by ignore rules, including those inside ignored
+    directories (walked separately, with skip_dirs pruned).
+    """
+    root = Path(project_path)
+    suffixes = set(suffixes) if suffixes is not None else None
+    skip_dirs = set(skip_dirs)
+    entries = []
+    walk_ignored = frozenset(skip_dirs) if include_ignored else None
+    for dirs, name, size, mtime_ns, ignored in _records(root, refresh, walk_ignored):
+        if ignored and not include_ignored:
+            continue
+        suffix = Path(name).suffix
+        if suffixes is not None and suffix not in suffixes:
+            continue
+        if skip_dirs and any(d in skip_dirs for d in dirs):
+            continue
+        rel = "/".join(dirs + (name,))
+        entries.append(FileEntry(root.joinpath(*dirs, name), rel, dirs, name, suffix, size, mtime_ns, ignored))
+    return entries
+
+
+def refresh_index(project_path) -> None:
+    """Forget the cached walk for project_path (after files were added or removed)."""
+    root = Path(project_path).resolve()
+    with _LOCK:
+        for key in [key for key in _INDEXES if key[0] == root]:
+            del _INDEXES[key]
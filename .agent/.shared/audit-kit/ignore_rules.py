@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Ignore Rules - Antigravity Kit
+==============================
+Compiles .gitignore / .agentignore files into regexes once, so the shared
+file walk can prune ignored directories before descending into them.
+
+Supported syntax follows gitignore: blank lines and '#' comments, '!'
+negation (last matching rule wins), trailing '/' for directory-only rules,
+a leading or middle '/' anchoring the pattern to the ignore file's
+directory, and '*', '?', '[...]' and '**' wildcards. .agentignore uses the
+same syntax for paths the checkers should skip but git should still track.
+
+Set AGENT_IGNORE_RULES=0 to walk everything (only ALWAYS_SKIP is pruned).
+
+Usage:
+    rules = IgnoreRules()
+    rules.add_file(root / ".gitignore", base="")
+    if rules.ignored("dist", is_dir=True): ...
+"""
+
+import os
+import re
+from pathlib import Path
+from typing import List, NamedTuple, Pattern
+
+IGNORE_FILES = ('.gitignore', '.agentignore')
+IGNORE_ENV = "AGENT_IGNORE_RULES"
+
+
+class Rule(NamedTuple):
+    base: str               # directory of the ignore file, relative to the root ('' for the root)
+    regex: Pattern
+    negate: bool
+    dir_only: bool
+
+
+def enabled() -> bool:
+    """False when AGENT_IGNORE_RULES turns ignore-file pruning off."""
+    return os.environ.get(IGNORE_ENV, "1").strip().lower() not in ("0", "false", "no", "off")
+
+
+def _translate(pattern: str) -> str:
+    """gitignore glob (already stripped of '!', anchors and trailing '/') to a regex body."""
+    out = []
+    i, n = 0, len(pattern)
+    while i < n:
+        c = pattern[i]
+        if pattern.startswith("**/", i) and (i == 0 or pattern[i - 1] == "/"):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i) and i + 2 == n and (i == 0 or pattern[i - 1] == "/"):
+            out.append(".*")
+            i += 2
+        elif c == "*":
+            out.append("[^/]*")
+            i += 1
+        elif c == "?":
+            out.append("[^/]")
+            i += 1
+        elif c == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape(c))
+                i += 1
+                continue
+            body = pattern[i + 1:end]
+            if body[0] in "!^":
+                body = "^" + body[1:]
+            out.append("[" + body.replace("\\", "\\\\") + "]")
+            i = end + 1
+        elif c == "\\" and i + 1 < n:
+            out.append(re.escape(pattern[i + 1]))
+            i += 2
+        else:
+            out.append(re.escape(c))
+            i += 1
+    return "".join(out)
+
+
+def compile_rule(line: str, base: str = ""):
+    """Rule for one ignore-file line, or None for blanks and comments."""
+    line = line.rstrip("\n").rstrip("\r")
+    if not line.endswith("\\ "):
+        line = line.rstrip(" ")
+    if not line or line.startswith("#"):
+        return None
+    negate = line.startswith("!")
+    if negate:
+        line = line[1:]
+    elif line.startswith("\\") and line[1:2] in ("#", "!"):
+        line = line[1:]
+    dir_only = line.endswith("/")
+    line = line.rstrip("/")
+    if not line:
+        return None
+    # A slash anywhere but the end anchors the pattern to the ignore file's directory
+    anchored = "/" in line
+    line = line.lstrip("/")
+    body = _translate(line)
+    regex = re.compile(("" if anchored else "(?:.*/)?") + body + r"\Z", re.DOTALL)
+    return Rule(base, regex, negate, dir_only)
+
+
+class IgnoreRules:
+    """Ordered ignore rules from every ignore file seen so far; the last match decides."""
+
+    def __init__(self):
+        self.rules: List[Rule] = []
+
+    def add_lines(self, lines, base: str = "") -> None:
+        for line in lines:
+            rule = compile_rule(line, base)
+            if rule:
+                self.rules.append(rule)
+
+    def add_file(self, path, base: str = "") -> None:
+        try:
+            text = Path(path).read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            return
+        self.add_lines(text.splitlines(), base)
+
+    def ignored(self, rel: str, is_dir: bool = False) -> bool:
+        """Whether the POSIX path rel (relative to the walk root) is ignored."""
+        result = False
+        for base, regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if base:
+                if not rel.startswith(base + "/"):
+                    continue
+                sub = rel[len(base) + 1:]
+            else:
+                sub = rel
+            if regex.match(sub):
+                result = not negate
+        return result
@@ -0,0 +1,290 @@
+#!/usr/bin/env python3
+"""
+Module Graph - Antigravity Kit
+==============================
+One pass over a JS/TS project that records, per source module, its size,
+static imports, re-exports, exports and dynamic import() / require() sites,
+then resolves relative and tsconfig-alias specifiers ('@/lib/x') to project
+files. Checkers query the graph (who imports this module, is it a barrel)
+instead of walking and re-reading the tree for every question.
+
+Specifiers are extracted with regexes, not a parser: good enough for
+import/export statements at the start of a line, which is how formatted
+code writes them. Bare package specifiers ('react') stay unresolved.
+
+Usage:
+    graph = module_graph(project_path, skip_dirs=SKIP_DIRS)
+    for module in graph.modules_with({'.tsx'}):
+        for importer, site in graph.importers(module.rel):
+            ...
+"""
+
+import json
+import posixpath
+import re
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from content_cache import SkippedFile, read_content
+from file_index import project_files
+
+SOURCE_SUFFIXES = {'.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs'}
+# Extensions tried, in order, for a specifier written without one
+RESOLVE_SUFFIXES = ('.ts', '.tsx', '.js', '.jsx', '.mjs', '.cjs', '.json')
+
+STATIC = 'static'           # import x from 'y'
+TYPE = 'type'               # import type { X } from 'y' (erased at build time)
+SIDE_EFFECT = 'side-effect' # import 'y'
+REEXPORT = 'reexport'       # export { x } from 'y' / export * from 'y'
+DYNAMIC = 'dynamic'         # import('y')
+REQUIRE = 'require'         # require('y')
+
+_SPEC = r"""['"](?P<spec>[^'"\n]+)['"]"""
+_IMPORT_RE = re.compile(
+    r"^[ \t]*import\s+(?P<type>type\s+)?(?P<clause>[\w$*{}\s,]+?)\s+from\s+" + _SPEC, re.MULTILINE)
+_SIDE_EFFECT_RE = re.compile(r"^[ \t]*import\s+" + _SPEC, re.MULTILINE)
+_REEXPORT_RE = re.compile(
+    r"^[ \t]*export\s+(?P<type>type\s+)?(?P<clause>\*(?:\s+as\s+[\w$]+)?|\{[^}]*\})\s+from\s+" + _SPEC,
+    re.MULTILINE)
+_DYNAMIC_RE = re.compile(r"\bimport\s*\(\s*" + _SPEC + r"\s*\)")
+_REQUIRE_RE = re.compile(r"\brequire\s*\(\s*" + _SPEC + r"\s*\)")
+_EXPORT_DECL_RE = re.compile(
+    r"^[ \t]*export\s+(?:declare\s+)?(?:default\s+)?(?:async\s+)?"
+    r"(?:const|let|var|function\*?|class|interface|type|enum)\s+(?P<name>[\w$]+)", re.MULTILINE)
+_EXPORT_DEFAULT_RE = re.compile(r"^[ \t]*export\s+default\b", re.MULTILINE)
+_EXPORT_LIST_RE = re.compile(r"^[ \t]*export\s+(?:type\s+)?\{(?P<names>[^}]*)\}(?!\s*from\b)", re.MULTILINE)
+_JSON_COMMENT_RE = re.compile(r'"(?:\\.|[^"\\])*"|//[^\n]*|/\*.*?\*/', re.DOTALL)
+
+_GRAPHS = {}
+_LOCK = threading.Lock()
+
+
+class ImportSite(NamedTuple):
+    spec: str                   # specifier as written
+    kind: str                   # STATIC, TYPE, SIDE_EFFECT, REEXPORT, DYNAMIC or REQUIRE
+    names: Tuple[str, ...]      # local names bound ('default', 'X', '*' for namespaces/export *)
+    line: int
+    target: Optional[str] = None  # resolved project-relative path, None for packages/unresolved
+
+
+class Module:
+    """One parsed source file."""
+
+    __slots__ = ("path", "rel", "suffix", "size", "imports", "exports", "content")
+
+    def __init__(self, path: Path, rel: str, suffix: str, size: int):
+        self.path = path
+        self.rel = rel
+        self.suffix = suffix
+        self.size = size
+        self.imports: List[ImportSite] = []
+        self.exports: List[str] = []
+        self.content = None     # FileContent, None when the file was skipped
+
+    @property
+    def text(self) -> str:
+        return self.content.text if self.content is not None else ""
+
+    @property
+    def stem(self) -> str:
+        return posixpath.splitext(posixpath.basename(self.rel))[0]
+
+    @property
+    def reexports(self) -> List[ImportSite]:
+        return [site for site in self.imports if site.kind == REEXPORT]
+
+    @property
+    def dynamic_imports(self) -> List[ImportSite]:
+        return [site for site in self.imports if site.kind == DYNAMIC]
+
+
+def _clause_names(clause: str) -> Tuple[str, ...]:
+    """Local names bound by an import clause ('React, { useState as s }' -> ('default', 'useState'))."""
+    names = []
+    clause = clause.strip()
+    braces = re.search(r"\{([^}]*)\}", clause)
+    head = clause[:braces.start()] if braces else clause
+    for part in head.split(","):
+        part = part.strip()
+        if part.startswith("*"):
+            names.append("*")
+        elif part:
+            names.append("default")
+    if braces:
+        for part in braces.group(1).split(","):
+            part = part.strip()
+            if part.startswith("type "):
+                part = part[5:].strip()
+            if part:
+                names.append(part.split(" as ")[0].strip())
+    return tuple(names)
+
+
+def parse_module(module: Module) -> None:
+    """Fill module.imports/exports from its content (unresolved targets)."""
+    content = module.content
+    text = content.text
+    line_of = content.line_number
+    sites = []
+    for match in _IMPORT_RE.finditer(text):
+        kind = TYPE if match.group("type") else STATIC
+        sites.append((match.start(), ImportSite(match.group("spec"), kind, _clause_names(match.group("clause")),
+                                                line_of(match.start()))))
+    for match in _SIDE_EFFECT_RE.finditer(text):
+        sites.append((match.start(), ImportSite(match.group("spec"), SIDE_EFFECT, (), line_of(match.start()))))
+    for match in _REEXPORT_RE.finditer(text):
+        kind = TYPE if match.group("type") else REEXPORT
+        clause = match.group("clause")
+        names = ("*",) if clause.startswith("*") else _clause_names(clause)
+        sites.append((match.start(), ImportSite(match.group("spec"), kind, names, line_of(match.start()))))
+    for regex, kind in ((_DYNAMIC_RE, DYNAMIC), (_REQUIRE_RE, REQUIRE)):
+        for match in regex.finditer(text):
+            sites.append((match.start(), ImportSite(match.group("spec"), kind, (), line_of(match.start()))))
+    sites.sort(key=lambda item: item[0])
+    module.imports = [site for _, site in sites]
+
+    exports = [m.group("name") for m in _EXPORT_DECL_RE.finditer(text)]
+    if _EXPORT_DEFAULT_RE.search(text) and "default" not in exports:
+        exports.append("default")
+    for match in _EXPORT_LIST_RE.finditer(text):
+        for part in match.group("names").split(","):
+            part = part.strip()
+            if part:
+                exports.append(part.split(" as ")[-1].strip())
+    module.exports = exports
+
+
+def _tsconfig_paths(root: Path) -> List[Tuple[str, str, List[str]]]:
+    """(prefix, suffix, [replacement targets]) for each compilerOptions.paths entry."""
+    for name in ("tsconfig.json", "jsconfig.json"):
+        try:
+            raw = (root / name).read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            continue
+        # tsconfig allows comments and trailing commas
+        raw = _JSON_COMMENT_RE.sub(lambda m: m.group(0) if m.group(0).startswith('"') else "", raw)
+        raw = re.sub(r",(\s*[}\]])", r"\1", raw)
+        try:
+            options = json.loads(raw).get("compilerOptions", {})
+        except (ValueError, AttributeError):
+            return []
+        base = posixpath.normpath(options.get("baseUrl", "."))
+        aliases = []
+        for pattern, targets in (options.get("paths") or {}).items():
+            prefix, star, suffix = pattern.partition("*")
+            resolved = [posixpath.normpath(posixpath.join(base, t)) for t in targets if isinstance(t, str)]
+            aliases.append((prefix, suffix if star else None, resolved))
+        return aliases
+    return []
+
+
+class ModuleGraph:
+    """Parsed modules of one project plus a reverse import index."""
+
+    def __init__(self, root: Path, modules: Dict[str, Module], files: set, aliases):
+        self.root = root
+        self.modules = modules
+        self._files = files
+        self._aliases = aliases
+        self._importers: Dict[str, List[Tuple[Module, ImportSite]]] = {}
+
+    def resolve(self, importer_rel: str, spec: str) -> Optional[str]:
+        """Project-relative path a specifier points at, or None (package or missing file)."""
+        if spec.startswith("."):
+            bases = [posixpath.normpath(posixpath.join(posixpath.dirname(importer_rel), spec))]
+        else:
+            bases = []
+            for prefix, suffix, targets in self._aliases:
+                if suffix is None:
+                    if spec == prefix:
+                        bases.extend(targets)
+                elif spec.startswith(prefix) and spec.endswith(suffix) and len(spec) >= len(prefix) + len(suffix):
+                    middle = spec[len(prefix):len(spec) - len(suffix)]
+                    bases.extend(posixpath.normpath(t.replace("*", middle, 1)) for t in targets)
+        for base in bases:
+            base = "" if base == "." else base
+            candidates = [base] if base else []
+            stem, ext = posixpath.splitext(base)
+            if ext in (".js", ".jsx", ".mjs", ".cjs"):
+                # TS sources import './x.js' meaning x.ts
+                candidates += [stem + s for s in (".ts", ".tsx", ".mts", ".cts")]
+            candidates += [base + s for s in RESOLVE_SUFFIXES]
+            candidates += [posixpath.join(base, "index" + s) for s in RESOLVE_SUFFIXES]
+            for candidate in candidates:
+                if candidate in self._files:
+                    return candidate
+        return None
+
+    def _link(self) -> None:
+        cache = {}
+        for module in self.modules.values():
+            linked = []
+            for site in module.imports:
+                key = (posixpath.dirname(module.rel), site.spec)
+                if key not in cache:
+                    cache[key] = self.resolve(module.rel, site.spec)
+                site = site._replace(target=cache[key])
+                linked.append(site)
+                if site.target is not None:
+                    self._importers.setdefault(site.target, []).append((module, site))
+            module.imports = linked
+
+    def modules_with(self, suffixes: Optional[Iterable[str]] = None) -> List[Module]:
+        """Parsed modules (in walk order), optionally limited to some suffixes."""
+        if suffixes is None:
+            return [m for m in self.modules.values() if m.content is not None]
+        suffixes = set(suffixes)
+        return [m for m in self.modules.values() if m.content is not None and m.suffix in suffixes]
+
+    def importers(self, rel: str, kinds: Optional[Iterable[str]] = None) -> List[Tuple[Module, ImportSite]]:
+        """(module, site) for every import that resolves to rel, optionally limited to some kinds."""
+        found = self._importers.get(rel, [])
+        if kinds is None:
+            return list(found)
+        kinds = set(kinds)
+        return [(m, site) for m, site in found if site.kind in kinds]
+
+    def is_barrel(self, rel: str, min_reexports: int = 2) -> bool:
+        """True for a module that mostly re-exports others (an index.ts gathering a folder)."""
+        module = self.modules.get(rel)
+        if module is None:
+            return False
+        reexports = len(module.reexports)
+        if not reexports:
+            return False
+        own = len(module.exports)
+        return (reexports >= min_reexports and reexports >= own) or (module.stem == "index" and own == 0)
+
+
+def build_graph(project_path, skip_dirs: Iterable[str] = (),
+                suffixes: Iterable[str] = SOURCE_SUFFIXES) -> ModuleGraph:
+    """Walk, read and parse every source module once, then resolve all specifiers."""
+    root = Path(project_path)
+    suffixes = set(suffixes)
+    skip_dirs = tuple(skip_dirs)
+    entries = project_files(root, skip_dirs=skip_dirs)
+    modules = {}
+    for entry in entries:
+        if entry.suffix not in suffixes or entry.name.endswith(".d.ts"):
+            continue
+        module = Module(entry.path, entry.rel, entry.suffix, entry.size)
+        try:
+            module.content = read_content(entry.path, guard=True)
+        except (SkippedFile, OSError):
+            modules[entry.rel] = module
+            continue
+        parse_module(module)
+        modules[entry.rel] = module
+    graph = ModuleGraph(root, modules, {entry.rel for entry in entries}, _tsconfig_paths(root))
+    graph._link()
+    return graph
+
+
+def module_graph(project_path, skip_dirs: Iterable[str] = (), refresh: bool = False) -> ModuleGraph:
+    """Shared graph for project_path (built once per process and skip_dirs set)."""
+    key = (Path(project_path).resolve(), frozenset(skip_dirs))
+    with _LOCK:
+        if refresh or key not in _GRAPHS:
+            _GRAPHS[key] = build_graph(project_path, skip_dirs)
+        return _GRAPHS[key]
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Result Cache - Antigravity Kit
+==============================
+Per-file result cache for the static checkers run by verify_all.py and
+checklist.py. A checker stores the result it computed for each file together
+with the file's content hash; on the next run only files whose content changed
+are analyzed again and everything else is served from the cache.
+
+The cache is enabled when the orchestrator exports AGENT_VERIFY_CACHE (the
+cache directory, normally <project>/.agent/.cache/verify; see
+configure_verify_cache). Checkers run by hand behave exactly as before.
+
+Usage (inside a checker):
+    cache = FileResultCache("seo_checker", project_path, salt=script_fingerprint(__file__))
+    for f in pages:
+        result = cache.get_or_compute(f, lambda: check_page(f))
+    cache.save()
+"""
+
+import functools
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+CACHE_ENV = "AGENT_VERIFY_CACHE"
+CACHE_VERSION = 1
+
+
+KIT_DIR = Path(__file__).resolve().parent
+
+
+def default_cache_dir(project_path) -> Path:
+    """Where orchestrators keep the verify cache for a project."""
+    return Path(project_path).resolve() / ".agent" / ".cache" / "verify"
+
+
+def configure_verify_cache(project_path, enabled: bool = True):
+    """Point static checkers (in-process and subprocess) at the per-file result cache."""
+    if enabled:
+        os.environ[CACHE_ENV] = str(default_cache_dir(project_path))
+    else:
+        os.environ.pop(CACHE_ENV, None)
+
+
+@functools.lru_cache(maxsize=None)
+def _kit_fingerprint() -> str:
+    """Hash of the audit-kit modules (file_index, ignore_rules, content_cache, module_graph, ...)."""
+    digest = hashlib.sha1()
+    for module in sorted(KIT_DIR.glob("*.py")):
+        digest.update(module.name.encode() + b"\0" + module.read_bytes() + b"\0")
+    return digest.hexdigest()
+
+
+def script_fingerprint(script_path) -> str:
+    """
+    Hash of a checker's own source and of the audit-kit it imports, so editing
+    its rules or a shared helper invalidates its cache.
+    """
+    try:
+        return hashlib.sha1(Path(script_path).read_bytes() + _kit_fingerprint().encode()).hexdigest()
+    except OSError:
+        return ""
+
+
+def _file_hash(filepath: Path) -> str:
+    with open(filepath, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+class FileResultCache:
+    """JSON-backed {relative path: (signature, content hash, result)} store for one checker."""
+
+    def __init__(self, checker: str, project_path, salt: str = "", cache_dir=None):
+        cache_dir = cache_dir or os.environ.get(CACHE_ENV)
+        self.enabled = bool(cache_dir)
+        self.project_path = Path(project_path).resolve()
+        self.salt = salt
+        self.entries = {}
+        self.seen = {}
+        self.hits = 0
+        self.misses = 0
+        if not self.enabled:
+            return
+
+        self.path = Path(cache_dir) / f"{checker}.json"
+        try:
+            data = json.loads(self.path.read_text(encoding='utf-8'))
+            if data.get("version") == CACHE_VERSION and data.get("salt") == salt:
+                self.entries = data.get("files", {})
+        except (OSError, ValueError):
+            pass
+
+    def _key(self, filepath: Path) -> str:
+        try:
+            return Path(filepath).resolve().relative_to(self.project_path).as_posix()
+        except ValueError:
+            return Path(filepath).resolve().as_posix()
+
+    def lookup(self, filepath):
+        """
+        (True, result) if filepath's cached result is still valid, else (False, token).
+        Pass the token to store() once the result is computed (possibly elsewhere).
+        """
+        if not self.enabled:
+            return False, None
+
+        filepath = Path(filepath)
+        key = self._key(filepath)
+        try:
+            st = filepath.stat()
+        except OSError:
+            return False, None
+        signature = [st.st_mtime_ns, st.st_size]
+
+        entry = self.entries.get(key)
+        if entry and entry["signature"] == signature:
+            self.hits += 1
+            self.seen[key] = entry
+            return True, entry["result"]
+
+        # mtime/size changed: fall back to the content hash before re-analyzing
+        try:
+            content_hash = _file_hash(filepath)
+        except OSError:
+            return False, None
+        if entry and entry["hash"] == content_hash:
+            self.hits += 1
+            entry["signature"] = signature
+            self.seen[key] = entry
+            return True, entry["result"]
+
+        self.misses += 1
+        return False, (key, signature, content_hash)
+
+    def store(self, token, result) -> None:
+        """Remember a result computed after a lookup() miss."""
+        if token is not None:
+            key, signature, content_hash = token
+            self.seen[key] = {"signature": signature, "hash": content_hash, "result": result}
+
+    def get_or_compute(self, filepath, compute):
+        """Return the cached result for filepath, or compute() and remember it."""
+        hit, value = self.lookup(filepath)
+        if hit:
+            return value
+        result = compute()
+        self.store(value, result)
+        return result
+
+    def save(self) -> None:
+        """Persist the entries used in this run (files no longer analyzed are dropped)."""
+        if not self.enabled:
+            return
+        payload = {"version": CACHE_VERSION, "salt": self.salt, "files": self.seen}
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(payload, f)
+            os.replace(tmp, self.path)
+        except OSError:
+            pass
@@ -5,95 +5,36 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import hashlib
+import heapq
+import os
+import pickle
 import re
+import tempfile
 from pathlib import Path
 from math import log
-from collections import defaultdict
+from collections import Counter, defaultdict
+
+# NumPy / SciPy are only needed by the "numpy" backend and cost ~250 ms to
+# import, so they are loaded on first use (see _load_numpy).
+np = None
+csr_matrix = None
+NUMPY_AVAILABLE = None      # None until _load_numpy() has tried the import
+SCIPY_AVAILABLE = None
 
 # ============ CONFIGURATION ============
-DATA_DIR = Path(__file__).parent.parent / "data"
-MAX_RESULTS = 3
-
-CSV_CONFIG = {
-    "style": {
-        "file": "styles.csv",
-        "search_cols": ["Style Category", "Keywords", "Best For", "Type"],
-        "output_cols": ["Style Category", "Type", "Keywords", "Primary Colors", "Effects & Animation", "Best For", "Performance", "Accessibility", "Framework Compatibility", "Complexity"]
-    },
-    "prompt": {
-        "file": "prompts.csv",
-        "search_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords"],
-        "output_cols": ["Style Category", "AI Prompt Keywords (Copy-Paste Ready)", "CSS/Technical Keywords", "Implementation Checklist"]
-    },
-    "color": {
-        "file": "colors.csv",
-        "search_cols": ["Product Type", "Keywords", "Notes"],
-        "output_cols": ["Product Type", "Keywords", "Primary (Hex)", "Secondary (Hex)", "CTA (Hex)", "Background (Hex)", "Text (Hex)", "Border (Hex)", "Notes"]
-    },
-    "chart": {
-        "file": "charts.csv",
-        "search_cols": ["Data Type", "Keywords", "Best Chart Type", "Accessibility Notes"],
-        "output_cols": ["Data Type", "Keywords", "Best Chart Type", "Secondary Options", "Color Guidance", "Accessibility Notes", "Library Recommendation", "Interactive Level"]
-    },
-    "landing": {
-        "file": "landing.csv",
-        "search_cols": ["Pattern Name", "Keywords", "Conversion Optimization", "Section Order"],
-        "output_cols": ["Pattern Name", "Keywords", "Section Order", "Primary CTA Placement", "Color Strategy", "Conversion Optimization"]
-    },
-    "product": {
-        "file": "products.csv",
-        "search_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Key Considerations"],
-        "output_cols": ["Product Type", "Keywords", "Primary Style Recommendation", "Secondary Styles", "Landing Page Pattern", "Dashboard Style (if applicable)", "Color Palette Focus"]
-    },
-    "ux": {
-        "file": "ux-guidelines.csv",
-        "search_cols": ["Category", "Issue", "Description", "Platform"],
-        "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
-    },
-    "typography": {
-        "file": "typography.csv",
-        "search_cols": ["Font Pairing Name", "Category", "Mood/Style Keywords", "Best For", "Heading Font", "Body Font"],
-        "output_cols": ["Font Pairing Name", "Category", "Heading Font", "Body Font", "Mood/Style Keywords", "Best For", "Google Fonts URL", "CSS Import", "Tailwind Config", "Notes"]
-    },
-    "icons": {
-        "file": "icons.csv",
-        "search_cols": ["Category", "Icon Name", "Keywords", "Best For"],
-        "output_cols": ["Category", "Icon Name", "Keywords", "Library", "Import Code", "Usage", "Best For", "Style"]
-    },
-    "react": {
-        "file": "react-performance.csv",
-        "search_cols": ["Category", "Issue", "Keywords", "Description"],
-        "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
-    },
-    "web": {
-        "file": "web-interface.csv",
-        "search_cols": ["Category", "Issue", "Keywords", "Description"],
-        "output_cols": ["Category", "Issue", "Platform", "Description", "Do", "Don't", "Code Example Good", "Code Example Bad", "Severity"]
-    }
-}
-
-STACK_CONFIG = {
-    "html-tailwind": {"file": "stacks/html-tailwind.csv"},
-    "react": {"file": "stacks/react.csv"},
-    "nextjs": {"file": "stacks/nextjs.csv"},
-    "vue": {"file": "stacks/vue.csv"},
-    "nuxtjs": {"file": "stacks/nuxtjs.csv"},
-    "nuxt-ui": {"file": "stacks/nuxt-ui.csv"},
-    "svelte": {"file": "stacks/svelte.csv"},
-    "swiftui": {"file": "stacks/swiftui.csv"},
-    "react-native": {"file": "stacks/react-native.csv"},
-    "flutter": {"file": "stacks/flutter.csv"},
-    "shadcn": {"file": "stacks/shadcn.csv"},
-    "jetpack-compose": {"file": "stacks/jetpack-compose.csv"}
-}
-
-# Common columns for all stacks
-_STACK_COLS = {
-    "search_cols": ["Category", "Guideline", "Description", "Do", "Don't"],
-    "output_cols": ["Category", "Guideline", "Description", "Do", "Don't", "Code Good", "Code Bad", "Severity", "Docs URL"]
-}
-
-AVAILABLE_STACKS = list(STACK_CONFIG.keys())
+# Data files, columns and paths live in search_config.py
+from search_config import (
+    AVAILABLE_STACKS, BACKEND_ENV, BM25_BACKENDS, CSV_CONFIG, DATA_DIR, INDEX_DIR, INDEX_VERSION,
+    MAX_RESULTS, STACK_CONFIG, STACK_COLS as _STACK_COLS,
+)
+
+# BM25 scoring backend: "python" (postings loop) or "numpy" (sparse matrix
+# products, see VectorBM25). "numpy" falls back to "python" without NumPy.
+# Override with UIUX_BM25_BACKEND (search.py --backend sets it) or set_backend().
+BM25_BACKEND = os.environ.get(BACKEND_ENV, "python").strip().lower()
+if BM25_BACKEND not in BM25_BACKENDS:
+    BM25_BACKEND = "python"
 
 
 # ============ BM25 IMPLEMENTATION ============
@@ -108,6 +49,9 @@ class BM25:
         self.avgdl = 0
         self.idf = {}
         self.doc_freqs = defaultdict(int)
+        self.term_freqs = []
+        self.postings = defaultdict(list)
+        self.doc_norms = []
         self.N = 0
 
     def tokenize(self, text):
@@ -124,39 +68,172 @@ class BM25:
         self.doc_lengths = [len(doc) for doc in self.corpus]
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
+        # Per-document term frequencies and term -> [(doc_idx, tf)] postings
+        for idx, doc in enumerate(self.corpus):
+            term_freqs = Counter(doc)
+            self.term_freqs.append(term_freqs)
+            for word, tf in term_freqs.items():
+                self.doc_freqs[word] += 1
+                self.postings[word].append((idx, tf))
 
         for word, freq in self.doc_freqs.items():
             self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
 
-    def score(self, query):
-        """Score all documents against query"""
+        # Length normalization is query-independent, so compute it once
+        self.doc_norms = [self.k1 * (1 - self.b + self.b * doc_len / self.avgdl) for doc_len in self.doc_lengths]
+
+    def score(self, query, top_k=None):
+        """
+        Score documents against query, best first.
+        Only documents containing a query term are touched (via postings) and
+        returned; with top_k, a heap selects the best k instead of a full sort.
+        """
         query_tokens = self.tokenize(query)
-        scores = []
+        scores = defaultdict(float)
 
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
-
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
+        for token in query_tokens:
+            if token in self.idf:
+                idf = self.idf[token]
+                for idx, tf in self.postings[token]:
                     numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
-
-            scores.append((idx, score))
-
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+                    denominator = tf + self.doc_norms[idx]
+                    scores[idx] += idf * numerator / denominator
+
+        # Ties keep corpus order, as with a stable sort
+        if top_k is not None:
+            return heapq.nsmallest(top_k, scores.items(), key=lambda x: (-x[1], x[0]))
+        return sorted(scores.items(), key=lambda x: (-x[1], x[0]))
+
+    def score_batch(self, queries, top_k=None):
+        """Score several queries; one ranking per query, in input order"""
+        return [self.score(query, top_k) for query in queries]
+
+    def get_state(self):
+        """Return the fitted index as plain data (for persistence)"""
+        return {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+
+    @classmethod
+    def from_state(cls, state):
+        """Rebuild a fitted BM25 from get_state() output without refitting"""
+        bm25 = cls()
+        bm25.__dict__.update(state)
+        return bm25
+
+
+class VectorBM25(BM25):
+    """
+    BM25 scored as sparse matrix operations.
+    The per (term, document) BM25 weight does not depend on the query, so it
+    is precomputed once into a term-document matrix; a batch of queries is then
+    a (queries x terms) count matrix times that matrix. Uses SciPy CSR when
+    available, plain NumPy CSR arrays otherwise.
+    """
+
+    def _ensure_matrix(self):
+        """
+        Build the weighted term-document matrix on first use.
+        _vocab is assigned last: the server searches from several threads, and
+        one that sees _vocab must also see the arrays it indexes.
+        """
+        if getattr(self, "_vocab", None) is not None:
+            return
+        vocab = {}
+        indptr, indices, weights = [0], [], []
+        for term, postings in self.postings.items():
+            vocab[term] = len(vocab)
+            idf = self.idf[term]
+            for idx, tf in postings:
+                indices.append(idx)
+                weights.append(idf * (tf * (self.k1 + 1)) / (tf + self.doc_norms[idx]))
+            indptr.append(len(indices))
+        indptr = np.array(indptr, dtype=np.int64)
+        indices = np.array(indices, dtype=np.int64)
+        weights = np.array(weights, dtype=np.float64)
+        self._matrix = csr_matrix((weights, indices, indptr), shape=(len(vocab), self.N)) if SCIPY_AVAILABLE else None
+        self._indptr, self._indices, self._weights = indptr, indices, weights
+        self._vocab = vocab
+
+    def _query_counts(self, query):
+        """Query as {term row: count}, ignoring out-of-vocabulary tokens"""
+        return Counter(self._vocab[token] for token in self.tokenize(query) if token in self._vocab)
+
+    def _score_matrix(self, queries):
+        """Dense (queries x documents) score matrix"""
+        counts = [self._query_counts(query) for query in queries]
+        if self._matrix is not None:
+            rows = [i for i, c in enumerate(counts) for _ in c]
+            cols = [term for c in counts for term in c]
+            vals = [n for c in counts for n in c.values()]
+            query_matrix = csr_matrix((vals, (rows, cols)), shape=(len(queries), len(self._vocab)))
+            return (query_matrix @ self._matrix).toarray()
+
+        scores = np.zeros((len(queries), self.N))
+        for i, c in enumerate(counts):
+            for term, n in c.items():
+                start, end = self._indptr[term], self._indptr[term + 1]
+                # Document indices are unique within one term row
+                scores[i, self._indices[start:end]] += n * self._weights[start:end]
+        return scores
+
+    def _rank(self, row, top_k):
+        """Matching documents of one score row, best first, ties by corpus order"""
+        matched = np.flatnonzero(row > 0)
+        if top_k is not None and 0 < top_k < len(matched):
+            # Keep every document tied with the k-th score so ties resolve by index
+            kth = np.partition(row[matched], len(matched) - top_k)[len(matched) - top_k]
+            matched = matched[row[matched] >= kth]
+        order = np.lexsort((matched, -row[matched]))
+        ranked = [(int(idx), float(row[idx])) for idx in matched[order]]
+        return ranked[:top_k] if top_k is not None else ranked
+
+    def score(self, query, top_k=None):
+        """Score documents against query, best first"""
+        return self.score_batch([query], top_k)[0]
+
+    def score_batch(self, queries, top_k=None):
+        """Score several queries with one matrix product"""
+        if self.N == 0:
+            return [[] for _ in queries]
+        self._ensure_matrix()
+        scores = self._score_matrix(queries)
+        return [self._rank(row, top_k) for row in scores]
+
+
+def _load_numpy():
+    """Import NumPy (and SciPy's CSR matrix when installed) on first use; False without NumPy"""
+    global np, csr_matrix, NUMPY_AVAILABLE, SCIPY_AVAILABLE
+    if NUMPY_AVAILABLE is None:
+        try:
+            from scipy.sparse import csr_matrix as scipy_csr
+            csr_matrix, SCIPY_AVAILABLE = scipy_csr, True
+        except ImportError:
+            SCIPY_AVAILABLE = False
+        try:
+            import numpy
+            np = numpy
+            available = True
+        except ImportError:
+            available = False
+        # Set last: other threads skip the imports once this is not None
+        NUMPY_AVAILABLE = available
+    return NUMPY_AVAILABLE
+
+
+def set_backend(name):
+    """Select the BM25 backend ("python" or "numpy") for this process"""
+    global BM25_BACKEND
+    if name not in BM25_BACKENDS:
+        raise ValueError(f"Unknown BM25 backend: {name} (expected one of {', '.join(BM25_BACKENDS)})")
+    BM25_BACKEND = name
+    # Worker processes (design system batches) pick it up from the environment
+    os.environ[BACKEND_ENV] = name
+
+
+def _bm25_class():
+    """BM25 implementation selected by BM25_BACKEND"""
+    if BM25_BACKEND == "numpy" and _load_numpy():
+        return VectorBM25
+    return BM25
 
 
 # ============ SEARCH FUNCTIONS ============
@@ -166,24 +243,122 @@ def _load_csv(filepath):
         return list(csv.DictReader(f))
 
 
-def _search_csv(filepath, search_cols, output_cols, query, max_results):
-    """Core search function using BM25"""
-    if not filepath.exists():
-        return []
+# In-process cache: (filepath, search_cols, backend) -> (stat signature, rows, bm25)
+_INDEX_CACHE = {}
+
+
+def _stat_signature(filepath):
+    """Cheap change detector for a source CSV"""
+    st = filepath.stat()
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _file_hash(filepath):
+    """Content hash of a source CSV, used when mtime/size changed"""
+    with open(filepath, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _index_path(filepath, search_cols):
+    """On-disk index file for a CSV and the columns it is searched on"""
+    key = hashlib.sha1("|".join([str(filepath.resolve())] + list(search_cols)).encode("utf-8")).hexdigest()[:12]
+    return INDEX_DIR / f"{filepath.stem}-{key}.idx"
+
+
+def _read_index(index_path):
+    """Load a persisted index, or None if missing, stale-format or unreadable"""
+    try:
+        with open(index_path, 'rb') as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.PickleError, EOFError, AttributeError, ValueError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != INDEX_VERSION:
+        return None
+    return payload
 
+
+def _write_index(index_path, payload):
+    """Atomically persist an index; a read-only cache dir is not an error"""
+    try:
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=index_path.parent, suffix=".tmp")
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, index_path)
+    except OSError:
+        pass
+
+
+def _build_index(filepath, search_cols):
+    """Read a CSV and fit a BM25 index over its search columns"""
     data = _load_csv(filepath)
 
     # Build documents from search columns
     documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
 
-    # BM25 search
     bm25 = BM25()
     bm25.fit(documents)
-    ranked = bm25.score(query)
+    return data, bm25
+
+
+def _get_index(filepath, search_cols):
+    """
+    Return (rows, bm25) for a CSV, loading in order from the in-process cache,
+    the on-disk index (valid while the CSV mtime/size or content hash match),
+    and finally a fresh fit that is written back to disk.
+    """
+    bm25_class = _bm25_class()
+    key = (str(filepath), tuple(search_cols), bm25_class.__name__)
+    signature = _stat_signature(filepath)
+
+    cached = _INDEX_CACHE.get(key)
+    if cached and cached[0] == signature:
+        return cached[1], cached[2]
+
+    index_path = _index_path(filepath, search_cols)
+    payload = _read_index(index_path)
+    if payload is not None and payload["signature"] != signature:
+        if payload["sha1"] == _file_hash(filepath):
+            # Touched but unchanged (e.g. git checkout): refresh the signature only
+            payload["signature"] = signature
+            _write_index(index_path, payload)
+        else:
+            payload = None
+
+    if payload is None:
+        data, bm25 = _build_index(filepath, search_cols)
+        payload = {
+            "version": INDEX_VERSION,
+            "search_cols": list(search_cols),
+            "signature": signature,
+            "sha1": _file_hash(filepath),
+            "rows": data,
+            "bm25": bm25.get_state(),
+        }
+        _write_index(index_path, payload)
+
+    rows, bm25 = payload["rows"], bm25_class.from_state(payload["bm25"])
+    _INDEX_CACHE[key] = (signature, rows, bm25)
+    return rows, bm25
+
+
+def _search_csv(filepath, search_cols, output_cols, query, max_results):
+    """Core search function using BM25"""
+    if not filepath.exists():
+        return []
+
+    data, bm25 = _get_index(filepath, search_cols)
+    return _top_results(data, bm25, output_cols, query, max_results)
+
+
+def _top_results(data, bm25, output_cols, query, max_results):
+    """Rank rows of a loaded index and project them onto output_cols"""
+    # BM25 search
+    ranked = bm25.score(query, top_k=max_results)
 
     # Get top results with score > 0
     results = []
-    for idx, score in ranked[:max_results]:
+    for idx, score in ranked:
         if score > 0:
             row = data[idx]
             results.append({col: row.get(col, "") for col in output_cols if col in row})
@@ -191,6 +366,18 @@ def _search_csv(filepath, search_cols, output_cols, query, max_results):
     return results
 
 
+def warm_indexes():
+    """Load every domain and stack index into the in-process cache"""
+    for config in CSV_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_index(filepath, config["search_cols"])
+    for config in STACK_CONFIG.values():
+        filepath = DATA_DIR / config["file"]
+        if filepath.exists():
+            _get_index(filepath, _STACK_COLS["search_cols"])
+
+
 def detect_domain(query):
     """Auto-detect the most relevant domain from query"""
     query_lower = query.lower()
@@ -256,3 +443,100 @@ def search_stack(query, stack, max_results=MAX_RESULTS):
         "count": len(results),
         "results": results
     }
+
+
+def _batch_record_error(record):
+    """Why a batch record cannot be searched, or None when it is well-formed."""
+    if not isinstance(record, dict):
+        return "not an object"
+    if not record.get("query") or not isinstance(record["query"], str):
+        return "no 'query' string"
+    for key in ("domain", "stack"):
+        if record.get(key) is not None and not isinstance(record[key], str):
+            return f"'{key}' must be a string"
+    max_results = record.get("max_results", MAX_RESULTS)
+    try:
+        # Numeric strings ("2") are accepted; bools, floats like 2.5 and values < 1 are not
+        if isinstance(max_results, bool) or int(max_results) < 1 or int(max_results) != float(max_results):
+            raise ValueError
+    except (TypeError, ValueError):
+        return "'max_results' must be a positive integer"
+    return None
+
+
+def search_batch(queries):
+    """
+    Run many searches in one call, sharing loaded indexes across the batch.
+    Each record is {"query", "domain" | "stack", "max_results"}; results are
+    returned in input order, with an error dict for malformed records.
+    """
+    results = []
+    for record in queries:
+        error = _batch_record_error(record)
+        if error:
+            results.append({"error": f"Invalid batch record ({error}): {record!r}"})
+            continue
+        max_results = int(record.get("max_results", MAX_RESULTS))
+        if record.get("stack"):
+            results.append(search_stack(record["query"], record["stack"], max_results))
+        else:
+            results.append(search(record["query"], record.get("domain"), max_results))
+    return results
+
+
+# ============ SHARED CORPUS ============
+class Corpus:
+    """
+    All domain indexes of a process held in memory, for callers that run many
+    lookups per request (e.g. DesignSystemGenerator). Lookups do not touch the
+    filesystem; refresh() picks up CSVs that changed since they were loaded.
+    """
+
+    def __init__(self, domains=None):
+        self.domains = list(domains) if domains else list(CSV_CONFIG)
+        self.indexes = {}
+        self.refresh()
+
+    def refresh(self):
+        """(Re)load every domain index whose CSV changed"""
+        for domain in self.domains:
+            config = CSV_CONFIG[domain]
+            filepath = DATA_DIR / config["file"]
+            if filepath.exists():
+                self.indexes[domain] = _get_index(filepath, config["search_cols"])
+            else:
+                self.indexes.pop(domain, None)
+
+    def search(self, query, domain, max_results=MAX_RESULTS):
+        """Same result shape as search() for an explicit domain"""
+        config = CSV_CONFIG[domain]
+        if domain not in self.indexes:
+            return {"error": f"File not found: {DATA_DIR / config['file']}", "domain": domain}
+
+        data, bm25 = self.indexes[domain]
+        results = _top_results(data, bm25, config["output_cols"], query, max_results)
+
+        return {
+            "domain": domain,
+            "query": query,
+            "file": config["file"],
+            "count": len(results),
+            "results": results
+        }
+
+    def search_domains(self, queries):
+        """Run {domain: (query, max_results)} lookups in one pass"""
+        return {domain: self.search(query, domain, max_results) for domain, (query, max_results) in queries.items()}
+
+
+_CORPUS = None
+
+
+def get_corpus():
+    """Process-wide Corpus over all domains, refreshed on each call"""
+    global _CORPUS
+    if _CORPUS is None:
+        _CORPUS = Corpus()
+    else:
+        _CORPUS.refresh()
+    return _CORPUS
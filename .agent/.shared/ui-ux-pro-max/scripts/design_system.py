@@ -11,14 +11,20 @@ Usage:
     # With persistence (Master + Overrides pattern)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True)
     result = generate_design_system("SaaS dashboard", "My Project", persist=True, page="dashboard")
+
+    # Batch (one process pool, one MASTER.md + page overrides per item)
+    reports = generate_design_system_batch([{"query": "SaaS dashboard", "project_name": "My Project", "pages": ["dashboard"]}])
 """
 
+import copy
 import csv
 import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import get_corpus, DATA_DIR
 
 
 # ============ CONFIGURATION ============
@@ -33,74 +39,42 @@ SEARCH_CONFIG = {
 }
 
 
-# ============ DESIGN SYSTEM GENERATOR ============
-class DesignSystemGenerator:
-    """Generates design system recommendations from aggregated searches."""
-
-    def __init__(self):
-        self.reasoning_data = self._load_reasoning()
-
-    def _load_reasoning(self) -> list:
-        """Load reasoning rules from CSV."""
-        filepath = DATA_DIR / REASONING_FILE
-        if not filepath.exists():
-            return []
-        with open(filepath, 'r', encoding='utf-8') as f:
-            return list(csv.DictReader(f))
-
-    def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
-        for domain, config in SEARCH_CONFIG.items():
-            if domain == "style" and style_priority:
-                # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
-            else:
-                results[domain] = search(query, domain, config["max_results"])
-        return results
-
-    def _find_reasoning_rule(self, category: str) -> dict:
-        """Find matching reasoning rule for a category."""
-        category_lower = category.lower()
+# ============ REASONING INDEX ============
+DEFAULT_REASONING = {
+    "pattern": "Hero + Features + CTA",
+    "style_priority": ["Minimalism", "Flat Design"],
+    "color_mood": "Professional",
+    "typography_mood": "Clean",
+    "key_effects": "Subtle hover transitions",
+    "anti_patterns": "",
+    "decision_rules": {},
+    "severity": "MEDIUM"
+}
 
-        # Try exact match first
-        for rule in self.reasoning_data:
-            if rule.get("UI_Category", "").lower() == category_lower:
-                return rule
 
-        # Try partial match
-        for rule in self.reasoning_data:
-            ui_cat = rule.get("UI_Category", "").lower()
-            if ui_cat in category_lower or category_lower in ui_cat:
-                return rule
+class ReasoningIndex:
+    """
+    ui-reasoning.csv compiled once: exact-match dict, ordered substring and
+    keyword tables, and each rule's reasoning (Decision_Rules JSON already
+    parsed). Resolved categories are memoized, so repeat lookups are a dict hit.
+    """
 
-        # Try keyword match
-        for rule in self.reasoning_data:
+    def __init__(self, rules: list):
+        self.rules = rules
+        self.exact = {}
+        self.partial = []
+        self.keywords = []
+        self.reasoning = []
+        for i, rule in enumerate(rules):
             ui_cat = rule.get("UI_Category", "").lower()
-            keywords = ui_cat.replace("/", " ").replace("-", " ").split()
-            if any(kw in category_lower for kw in keywords):
-                return rule
-
-        return {}
-
-    def _apply_reasoning(self, category: str, search_results: dict) -> dict:
-        """Apply reasoning rules to search results."""
-        rule = self._find_reasoning_rule(category)
-
-        if not rule:
-            return {
-                "pattern": "Hero + Features + CTA",
-                "style_priority": ["Minimalism", "Flat Design"],
-                "color_mood": "Professional",
-                "typography_mood": "Clean",
-                "key_effects": "Subtle hover transitions",
-                "anti_patterns": "",
-                "decision_rules": {},
-                "severity": "MEDIUM"
-            }
-
+            self.exact.setdefault(ui_cat, i)
+            self.partial.append((ui_cat, i))
+            self.keywords.append((ui_cat.replace("/", " ").replace("-", " ").split(), i))
+            self.reasoning.append(self._compile(rule))
+        self._resolved = {}
+
+    @staticmethod
+    def _compile(rule: dict) -> dict:
         # Parse decision rules JSON
         decision_rules = {}
         try:
@@ -119,6 +93,84 @@ class DesignSystemGenerator:
             "severity": rule.get("Severity", "MEDIUM")
         }
 
+    def _resolve(self, category: str):
+        """Index of the matching rule (exact, then partial, then keyword), or None."""
+        category_lower = category.lower()
+        if category_lower not in self._resolved:
+            match = self.exact.get(category_lower)
+            if match is None:
+                match = next((i for ui_cat, i in self.partial
+                              if ui_cat in category_lower or category_lower in ui_cat), None)
+            if match is None:
+                match = next((i for keywords, i in self.keywords
+                              if any(kw in category_lower for kw in keywords)), None)
+            self._resolved[category_lower] = match
+        return self._resolved[category_lower]
+
+    def find_rule(self, category: str) -> dict:
+        """Matching raw CSV rule for a category, or {}."""
+        match = self._resolve(category)
+        return self.rules[match] if match is not None else {}
+
+    def reasoning_for(self, category: str) -> dict:
+        """Compiled reasoning for a category (defaults when no rule matches)."""
+        match = self._resolve(category)
+        reasoning = self.reasoning[match] if match is not None else DEFAULT_REASONING
+        # Callers get their own copy; the compiled table stays pristine
+        return copy.deepcopy(reasoning)
+
+
+# Compiled reasoning index per process, keyed on the CSV's (mtime, size)
+_REASONING_CACHE = {}
+
+
+def load_reasoning_index() -> ReasoningIndex:
+    """Load and compile ui-reasoning.csv once per process (until it changes)."""
+    filepath = DATA_DIR / REASONING_FILE
+    if not filepath.exists():
+        return ReasoningIndex([])
+    st = filepath.stat()
+    signature = (st.st_mtime_ns, st.st_size)
+    cached = _REASONING_CACHE.get(str(filepath))
+    if cached and cached[0] == signature:
+        return cached[1]
+    with open(filepath, 'r', encoding='utf-8') as f:
+        index = ReasoningIndex(list(csv.DictReader(f)))
+    _REASONING_CACHE[str(filepath)] = (signature, index)
+    return index
+
+
+# ============ DESIGN SYSTEM GENERATOR ============
+class DesignSystemGenerator:
+    """Generates design system recommendations from aggregated searches."""
+
+    def __init__(self, corpus=None):
+        self.corpus = corpus or get_corpus()
+        self.reasoning_index = load_reasoning_index()
+        self.reasoning_data = self.reasoning_index.rules
+
+    def _multi_domain_search(self, query: str, style_priority: list = None, skip: tuple = ()) -> dict:
+        """Execute searches across multiple domains against the shared corpus."""
+        queries = {}
+        for domain, config in SEARCH_CONFIG.items():
+            if domain in skip:
+                continue
+            if domain == "style" and style_priority:
+                # For style, also search with priority keywords
+                priority_query = " ".join(style_priority[:2]) if style_priority else query
+                queries[domain] = (f"{query} {priority_query}", config["max_results"])
+            else:
+                queries[domain] = (query, config["max_results"])
+        return self.corpus.search_domains(queries)
+
+    def _find_reasoning_rule(self, category: str) -> dict:
+        """Find matching reasoning rule for a category."""
+        return self.reasoning_index.find_rule(category)
+
+    def _apply_reasoning(self, category: str, search_results: dict) -> dict:
+        """Apply reasoning rules to search results."""
+        return self.reasoning_index.reasoning_for(category)
+
     def _select_best_match(self, results: list, priority_keywords: list) -> dict:
         """Select best matching result based on priority keywords."""
         if not results:
@@ -163,7 +215,7 @@ class DesignSystemGenerator:
     def generate(self, query: str, project_name: str = None) -> dict:
         """Generate complete design system recommendation."""
         # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
+        product_result = self.corpus.search(query, "product", SEARCH_CONFIG["product"]["max_results"])
         product_results = product_result.get("results", [])
         category = "General"
         if product_results:
@@ -174,7 +226,7 @@ class DesignSystemGenerator:
         style_priority = reasoning.get("style_priority", [])
 
         # Step 3: Multi-domain search with style priority hints
-        search_results = self._multi_domain_search(query, style_priority)
+        search_results = self._multi_domain_search(query, style_priority, skip=("product",))
         search_results["product"] = product_result  # Reuse product search
 
         # Step 4: Select best matches from each domain using priority
@@ -487,8 +539,96 @@ def generate_design_system(query: str, project_name: str = None, output_format:
     return format_ascii_box(design_system)
 
 
+# ============ BATCH GENERATION ============
+def manifest_item_error(item) -> str:
+    """Why a manifest item cannot be generated, or None when it is well-formed."""
+    if not isinstance(item, dict):
+        return f"manifest item must be an object, got {type(item).__name__}"
+    if not item.get("query") or not isinstance(item["query"], str):
+        return "manifest item has no 'query' string"
+    if item.get("project_name") is not None and not isinstance(item["project_name"], str):
+        return "'project_name' must be a string"
+    pages = item.get("pages", [])
+    if not isinstance(pages, list) or not all(isinstance(page, str) and page.strip() for page in pages):
+        return "'pages' must be a list of page names"
+    return None
+
+
+def _generate_batch_item(item: dict, output_dir: str = None) -> dict:
+    """Generate and persist one manifest item (runs inside a worker process)."""
+    start = time.perf_counter()
+    report = {"query": item.get("query"), "project_name": item.get("project_name")} if isinstance(item, dict) \
+        else {"query": None, "project_name": None}
+    try:
+        error = manifest_item_error(item)
+        if error:
+            raise ValueError(error)
+        design_system = DesignSystemGenerator().generate(item["query"], item.get("project_name"))
+        report.update(persist_design_system(design_system, output_dir=output_dir, page_query=item["query"],
+                                            pages=item.get("pages", [])))
+    except Exception as e:
+        report.update({"status": "error", "error": f"{type(e).__name__}: {e}"})
+    report["seconds"] = round(time.perf_counter() - start, 3)
+    return report
+
+
+def generate_design_system_batch(manifest: list, output_dir: str = None, jobs: int = None) -> list:
+    """
+    Generate and persist design systems for many projects at once.
+
+    Args:
+        manifest: List of {"query", "project_name", "pages": [...]} items
+        output_dir: Optional output directory (defaults to current working directory)
+        jobs: Worker processes (default: CPU count); 1 runs in-process
+
+    Returns:
+        One report per item, in manifest order, with created files and timing
+    """
+    check_manifest_slugs(manifest)
+    output_dir = str(Path(output_dir or Path.cwd()).resolve())
+    jobs = jobs or os.cpu_count() or 1
+    if jobs == 1 or len(manifest) <= 1:
+        return [_generate_batch_item(item, output_dir) for item in manifest]
+
+    # Each worker builds its own corpus once and reuses it for all its items
+    with ProcessPoolExecutor(max_workers=min(jobs, len(manifest))) as executor:
+        return list(executor.map(_generate_batch_item, manifest, [output_dir] * len(manifest)))
+
+
+def load_manifest(path: str) -> list:
+    """Load a batch manifest: a JSON array, or one JSON object per line."""
+    with open(path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    try:
+        manifest = json.loads(content)
+    except json.JSONDecodeError:
+        manifest = [json.loads(line) for line in content.splitlines() if line.strip()]
+    if isinstance(manifest, dict):
+        manifest = [manifest]
+    check_manifest_slugs(manifest)
+    return manifest
+
+
+def check_manifest_slugs(manifest: list) -> None:
+    """
+    Raise ValueError when two items would persist to the same design-system/<slug>/.
+
+    Items run concurrently, so a shared slug means one silently overwrites the other.
+    """
+    seen = {}
+    for i, item in enumerate(manifest):
+        if manifest_item_error(item):
+            continue  # reported as an error item by _generate_batch_item
+        # Same slug persist_design_system derives (project_name defaults to the query)
+        slug = (item.get("project_name") or item["query"].upper()).lower().replace(' ', '-')
+        if slug in seen:
+            raise ValueError(f"manifest items {seen[slug] + 1} and {i + 1} both write design-system/{slug}/")
+        seen[slug] = i
+
+
 # ============ PERSISTENCE FUNCTIONS ============
-def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None) -> dict:
+def persist_design_system(design_system: dict, page: str = None, output_dir: str = None, page_query: str = None,
+                          pages: list = None) -> dict:
     """
     Persist design system to design-system/<project>/ folder using Master + Overrides pattern.
     
@@ -497,6 +637,7 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         page: Optional page name for page-specific override file
         output_dir: Optional output directory (defaults to current working directory)
         page_query: Optional query string for intelligent page override generation
+        pages: Optional list of additional page names, one override file each
     
     Returns:
         dict with created file paths and status
@@ -524,10 +665,10 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         f.write(master_content)
     created_files.append(str(master_file))
     
-    # If page is specified, create page override file with intelligent content
-    if page:
-        page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
+    # If pages are specified, create page override files with intelligent content
+    for page_name in ([page] if page else []) + list(pages or []):
+        page_file = pages_dir / f"{page_name.lower().replace(' ', '-')}.md"
+        page_content = format_page_override_md(design_system, page_name, page_query)
         with open(page_file, 'w', encoding='utf-8') as f:
             f.write(page_content)
         created_files.append(str(page_file))
@@ -918,21 +1059,21 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     Uses the existing search infrastructure to find relevant style, UX, and layout
     data instead of hardcoded page types.
     """
-    from core import search
-    
     page_lower = page_name.lower()
     query_lower = (page_query or "").lower()
     combined_context = f"{page_lower} {query_lower}"
     
     # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
+    searches = get_corpus().search_domains({
+        "style": (combined_context, 1),
+        "ux": (combined_context, 3),
+        "landing": (combined_context, 1),
+    })
     
     # Extract results from search response
-    style_results = style_search.get("results", [])
-    ux_results = ux_search.get("results", [])
-    landing_results = landing_search.get("results", [])
+    style_results = searches["style"].get("results", [])
+    ux_results = searches["ux"].get("results", [])
+    landing_results = searches["landing"].get("results", [])
     
     # Detect page type from search results or context
     page_type = _detect_page_type(combined_context, style_results)
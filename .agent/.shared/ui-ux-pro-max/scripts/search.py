@@ -5,6 +5,8 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py --batch [queries.jsonl]   (reads stdin when no file is given)
+       python search.py --manifest projects.json [--jobs 4] [-o out/]
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,11 +14,30 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+
+Batch mode (one JSON record per line in, one JSON result per line out):
+  {"query": "fintech", "domain": "color", "max_results": 2}
+  {"query": "forms", "stack": "react"}
+
+Design system batch (--manifest, JSON array or JSONL, generated in a process pool):
+  [{"query": "SaaS dashboard", "project_name": "Acme", "pages": ["dashboard", "pricing"]}]
+
+Server mode:
+  When search_server.py is running, queries are answered by it (warm indexes).
+  --persist always runs in-process: the server never writes files.
+  --no-server  Always search in-process
+  --backend    BM25 backend for in-process search: python (default) or numpy
+               (also UIUX_BM25_BACKEND); a running server keeps its own
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import json
+import os
+import sys
+# Only the stdlib-light config and client are imported up front; the search
+# engine (core, design_system) is imported only when a request runs in-process
+from search_config import CSV_CONFIG, AVAILABLE_STACKS, BACKEND_ENV, BM25_BACKENDS, MAX_RESULTS
+from search_client import ServerError, call
 
 
 def format_output(result):
@@ -45,9 +66,36 @@ def format_output(result):
     return "\n".join(output)
 
 
+def run(op, use_server, **kwargs):
+    """call() with a server-side failure reported like any other error"""
+    try:
+        return call(op, use_server=use_server, **kwargs)
+    except ServerError as e:
+        print(f"Error: search server: {e}")
+        sys.exit(1)
+
+
+def read_batch(source, default_max_results):
+    """Parse JSONL batch records; unparseable lines are passed on as-is and reported as invalid"""
+    stream = sys.stdin if source == "-" else open(source, 'r', encoding='utf-8')
+    records = []
+    with stream:
+        for line in stream:
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                record = line.strip()
+            if isinstance(record, dict):
+                record.setdefault("max_results", default_max_results)
+            records.append(record)
+    return records
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
@@ -60,19 +108,74 @@ if __name__ == "__main__":
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    parser.add_argument("--no-server", action="store_true", help="Do not use a running search_server.py")
+    parser.add_argument("--backend", choices=BM25_BACKENDS, default=None, help="BM25 backend for in-process search (default: $UIUX_BM25_BACKEND or python)")
+    # Batch mode
+    parser.add_argument("--batch", nargs="?", const="-", default=None, metavar="FILE", help="Run JSONL query records from FILE (or stdin) and print JSONL results")
+
+    parser.add_argument("--manifest", type=str, default=None, metavar="FILE", help="Generate and persist design systems for every {query, project_name, pages} item in FILE")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="Worker processes for --manifest (default: CPU count)")
 
     args = parser.parse_args()
+    if args.query is None and args.batch is None and args.manifest is None:
+        parser.error("a query is required unless --batch or --manifest is used")
+
+    use_server = not args.no_server
+    if args.backend:
+        # Read by core on its (lazy) import and inherited by --manifest workers
+        os.environ[BACKEND_ENV] = args.backend
 
-    # Design system takes priority
-    if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
-            args.format,
-            persist=args.persist,
-            page=args.page,
-            output_dir=args.output_dir
-        )
+    # Batch modes take priority
+    if args.manifest:
+        from design_system import generate_design_system_batch, load_manifest
+        try:
+            manifest = load_manifest(args.manifest)
+        except (OSError, ValueError) as e:
+            print(f"❌ Invalid manifest {args.manifest}: {e}")
+            sys.exit(1)
+        reports = generate_design_system_batch(manifest, args.output_dir, args.jobs)
+        if args.json:
+            print(json.dumps(reports, indent=2, ensure_ascii=False))
+        else:
+            for i, report in enumerate(reports, 1):
+                if report.get("status") == "error":
+                    label = report['project_name'] or report['query'] or f"item {i}"
+                    print(f"❌ {label} ({report['seconds']:.2f}s): {report['error']}")
+                else:
+                    print(f"✅ {report['design_system_dir']} ({len(report['created_files'])} files, {report['seconds']:.2f}s)")
+            print(f"\n{sum(r.get('status') != 'error' for r in reports)}/{len(reports)} design systems generated")
+        if any(r.get("status") == "error" for r in reports):
+            sys.exit(1)
+    elif args.batch is not None:
+        try:
+            queries = read_batch(args.batch, args.max_results)
+        except (OSError, UnicodeDecodeError) as e:
+            print(json.dumps({"error": f"Cannot read batch file {args.batch}: {e}"}, ensure_ascii=False))
+            sys.exit(1)
+        for result in run("search_batch", use_server=use_server, queries=queries):
+            print(json.dumps(result, ensure_ascii=False))
+    # Design system
+    elif args.design_system:
+        if args.persist:
+            # The server never writes files, so persisting always runs in-process
+            result = run(
+                "generate_design_system",
+                use_server=False,
+                query=args.query,
+                project_name=args.project_name,
+                output_format=args.format,
+                persist=True,
+                page=args.page,
+                output_dir=args.output_dir
+            )
+        else:
+            result = run(
+                "generate_design_system",
+                use_server=use_server,
+                query=args.query,
+                project_name=args.project_name,
+                output_format=args.format
+            )
         print(result)
         
         # Print persistence confirmation
@@ -90,17 +193,15 @@ if __name__ == "__main__":
             print("=" * 60)
     # Stack search
     elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
+        result = run("search_stack", use_server=use_server, query=args.query, stack=args.stack, max_results=args.max_results)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
     # Domain search
     else:
-        result = search(args.query, args.domain, args.max_results)
+        result = run("search", use_server=use_server, query=args.query, domain=args.domain, max_results=args.max_results)
         if args.json:
-            import json
             print(json.dumps(result, indent=2, ensure_ascii=False))
         else:
             print(format_output(result))
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Client - sends requests to a running search_server.py
+and falls back to in-process execution when none is reachable.
+
+Only socket/json are imported up front: the search engine (core.py,
+design_system.py) is imported on the first local fallback, so a request
+answered by the server never pays for it.
+"""
+
+import importlib
+import json
+import socket
+
+from search_config import INDEX_DIR
+
+DEFAULT_PORT = 7465
+HOST = "127.0.0.1"
+STATE_FILE = INDEX_DIR / "server.json"
+CONNECT_TIMEOUT = 0.2
+REQUEST_TIMEOUT = 30
+
+# op -> (module, function) run by the local fallback
+LOCAL_OPS = {
+    "search": ("core", "search"),
+    "search_stack": ("core", "search_stack"),
+    "search_batch": ("core", "search_batch"),
+    "generate_design_system": ("design_system", "generate_design_system"),
+}
+
+
+def read_state():
+    """{"pid", "port"} of the running server, or None."""
+    try:
+        return json.loads(STATE_FILE.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def request(op, args=None, timeout=REQUEST_TIMEOUT):
+    """
+    Send one request to a running server.
+    Returns the response dict, or None when no server is reachable.
+    """
+    state = read_state()
+    if not state:
+        return None
+    try:
+        with socket.create_connection((HOST, state["port"]), timeout=CONNECT_TIMEOUT) as sock:
+            sock.settimeout(timeout)
+            sock.sendall((json.dumps({"op": op, "args": args or {}}) + "\n").encode("utf-8"))
+            with sock.makefile("rb") as f:
+                line = f.readline()
+    except (OSError, KeyError, TypeError):
+        return None
+    try:
+        return json.loads(line) if line else None
+    except ValueError:
+        return None
+
+
+def run_local(op, **kwargs):
+    """Run op in this process, importing the search engine on first use."""
+    module, name = LOCAL_OPS[op]
+    return getattr(importlib.import_module(module), name)(**kwargs)
+
+
+class ServerError(RuntimeError):
+    """The server was reached but the op failed there."""
+
+
+def call(op, use_server=True, **kwargs):
+    """
+    Run op on the server if one is up, otherwise in-process.
+    Raises ServerError when the server answers with an error (it is not retried locally).
+    """
+    if use_server:
+        response = request(op, kwargs)
+        if response is not None:
+            if response.get("ok"):
+                return response["result"]
+            raise ServerError(response.get("error") or "unknown server error")
+    return run_local(op, **kwargs)
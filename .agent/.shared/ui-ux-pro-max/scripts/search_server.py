@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Search Server - keeps every BM25 index warm in one resident
+process so search.py lookups skip CSV indexing and module import.
+
+Usage:
+    python search_server.py start [--port 7465]   # run in the background
+    python search_server.py serve [--port 7465]   # run in the foreground
+    python search_server.py stop
+    python search_server.py status
+
+Protocol (localhost TCP, one JSON object per line):
+    -> {"op": "search", "args": {"query": "saas", "domain": "style", "max_results": 3}}
+    <- {"ok": true, "result": {...}}
+
+Ops: search, search_stack, search_batch, generate_design_system, ping, shutdown.
+search.py uses a running server automatically and falls back to in-process
+search when none is reachable.
+
+The listener is unauthenticated, so no op writes files: generate_design_system
+only renders, and search.py --persist always runs in-process.
+"""
+
+import argparse
+import json
+import os
+import signal
+import socketserver
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from core import search, search_batch, search_stack, warm_indexes
+from design_system import generate_design_system
+# Client side lives in search_client.py so search.py can reach the server
+# without importing the search engine
+from search_client import DEFAULT_PORT, HOST, STATE_FILE, read_state, request
+
+
+
+def _render_design_system(query, project_name=None, output_format="ascii"):
+    """generate_design_system without persist/output_dir: the server never writes files."""
+    return generate_design_system(query, project_name, output_format)
+
+
+OPS = {
+    "search": search,
+    "search_stack": search_stack,
+    "search_batch": search_batch,
+    "generate_design_system": _render_design_system,
+}
+
+
+# ============ SERVER ============
+class _Handler(socketserver.StreamRequestHandler):
+    """Answer newline-delimited JSON requests on one connection."""
+
+    def handle(self):
+        for line in self.rfile:
+            if not line.strip():
+                continue
+            response = self._dispatch(line)
+            self.wfile.write((json.dumps(response, ensure_ascii=False) + "\n").encode("utf-8"))
+            self.wfile.flush()
+            if response.get("result") == "shutting down":
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+    def _dispatch(self, line):
+        try:
+            request = json.loads(line)
+            op = request.get("op")
+            args = request.get("args", {})
+            if op == "ping":
+                return {"ok": True, "result": "pong"}
+            if op == "shutdown":
+                return {"ok": True, "result": "shutting down"}
+            if op not in OPS:
+                return {"ok": False, "error": f"Unknown op: {op}"}
+            return {"ok": True, "result": OPS[op](**args)}
+        except Exception as e:
+            return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+
+
+class SearchServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+def serve(port=DEFAULT_PORT):
+    """Warm all indexes and serve requests until stopped."""
+    warm_indexes()
+    with SearchServer((HOST, port), _Handler) as server:
+        STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        STATE_FILE.write_text(json.dumps({"pid": os.getpid(), "port": server.server_address[1]}))
+        print(f"🚀 Search server listening on {HOST}:{server.server_address[1]} (PID: {os.getpid()})", flush=True)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            try:
+                STATE_FILE.unlink()
+            except OSError:
+                pass
+
+
+# ============ CLI ============
+def start(port):
+    if request("ping") is not None:
+        print(f"⚠️  Search server already running (PID: {read_state()['pid']})")
+        return
+    kwargs = {"start_new_session": True} if sys.platform != "win32" else {"creationflags": subprocess.DETACHED_PROCESS}
+    process = subprocess.Popen(
+        [sys.executable, str(Path(__file__).resolve()), "serve", "--port", str(port)],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        **kwargs
+    )
+    for _ in range(50):
+        if request("ping") is not None:
+            print(f"✅ Search server started on {HOST}:{port} (PID: {process.pid})")
+            return
+        time.sleep(0.1)
+    print("❌ Search server did not come up")
+    sys.exit(1)
+
+
+def stop():
+    state = read_state()
+    if request("shutdown") is not None:
+        print("🛑 Search server stopped")
+        return
+    if state:
+        # Unresponsive server: fall back to killing the recorded PID
+        try:
+            os.kill(state["pid"], signal.SIGTERM)
+        except (OSError, KeyError):
+            pass
+        try:
+            STATE_FILE.unlink()
+        except OSError:
+            pass
+        print(f"🛑 Search server (PID: {state.get('pid')}) terminated")
+        return
+    print("ℹ️  Search server is not running")
+
+
+def status():
+    state = read_state()
+    if state and request("ping") is not None:
+        print(f"✅ Search server running on {HOST}:{state['port']} (PID: {state['pid']})")
+    else:
+        print("⚪ Search server is not running")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="UI Pro Max Search Server")
+    parser.add_argument("action", choices=["start", "serve", "stop", "status"])
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT, help=f"Port on {HOST} (default: {DEFAULT_PORT})")
+    args = parser.parse_args()
+
+    if args.action == "start":
+        start(args.port)
+    elif args.action == "serve":
+        serve(args.port)
+    elif args.action == "stop":
+        stop()
+    else:
+        status()
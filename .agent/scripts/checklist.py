@@ -9,6 +9,7 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --no-cache         # Re-analyze every file
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -26,6 +27,10 @@ import argparse
 from pathlib import Path
 from typing import List, Tuple, Optional
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / ".shared" / "audit-kit"))
+from result_cache import configure_verify_cache
+from checker_runner import load_checker, run_in_process
+
 # ANSI colors for terminal output
 class Colors:
     HEADER = '\033[95m'
@@ -54,6 +59,9 @@ def print_warning(text: str):
 def print_error(text: str):
     print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
+# Per-check time limit (subprocess and in-process checkers alike)
+CHECK_TIMEOUT = 300  # 5 minutes
+
 # Define priority-ordered checks
 CORE_CHECKS = [
     ("Security Scan", ".agent/skills/vulnerability-scanner/scripts/security_scan.py", True),
@@ -73,12 +81,13 @@ def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None, in_process: bool = True) -> dict:
     """
-    Run a validation script and capture results
+    Run a validation script and capture results.
+    Checkers exposing run_check() are called in this process; others run as a subprocess.
     
     Returns:
-        dict with keys: name, passed, output, skipped
+        dict with keys: name, passed, output, skipped (and data for in-process checks)
     """
     if not check_script_exists(script_path):
         print_warning(f"{name}: Script not found, skipping")
@@ -86,6 +95,8 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     
     print_step(f"Running: {name}")
     
+    check = load_checker(script_path) if in_process else None
+    
     # Build command
     cmd = ["python", str(script_path), project_path]
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
@@ -93,31 +104,36 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     
     # Run script
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=300  # 5 minute timeout
-        )
+        if check:
+            result = run_in_process(check, project_path, timeout=CHECK_TIMEOUT)
+        else:
+            process = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=CHECK_TIMEOUT
+            )
+            result = {"passed": process.returncode == 0, "output": process.stdout, "error": process.stderr, "data": None}
         
-        passed = result.returncode == 0
+        passed = result["passed"]
         
         if passed:
             print_success(f"{name}: PASSED")
         else:
             print_error(f"{name}: FAILED")
-            if result.stderr:
-                print(f"  Error: {result.stderr[:200]}")
+            if result["error"]:
+                print(f"  Error: {result['error'][:200]}")
         
         return {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "output": result["output"],
+            "error": result["error"],
+            "data": result["data"],
             "skipped": False
         }
     
-    except subprocess.TimeoutExpired:
+    except (subprocess.TimeoutExpired, TimeoutError):
         print_error(f"{name}: TIMEOUT (>5 minutes)")
         return {"name": name, "passed": False, "output": "", "error": "Timeout", "skipped": False}
     
@@ -172,6 +188,8 @@ Examples:
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--subprocess", action="store_true", help="Run every checker in its own Python process")
+    parser.add_argument("--no-cache", action="store_true", help="Re-analyze every file (ignore the per-file result cache)")
     
     args = parser.parse_args()
     
@@ -181,6 +199,9 @@ Examples:
         print_error(f"Project path does not exist: {project_path}")
         sys.exit(1)
     
+    configure_verify_cache(project_path, enabled=not args.no_cache)
+    in_process = not args.subprocess
+    
     print_header("🚀 ANTIGRAVITY KIT - MASTER CHECKLIST")
     print(f"Project: {project_path}")
     print(f"URL: {args.url if args.url else 'Not provided (performance checks skipped)'}")
@@ -191,7 +212,7 @@ Examples:
     print_header("📋 CORE CHECKS")
     for name, script_path, required in CORE_CHECKS:
         script = project_path / script_path
-        result = run_script(name, script, str(project_path))
+        result = run_script(name, script, str(project_path), in_process=in_process)
         results.append(result)
         
         # If required check fails, stop
@@ -205,7 +226,7 @@ Examples:
         print_header("⚡ PERFORMANCE CHECKS")
         for name, script_path, required in PERFORMANCE_CHECKS:
             script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
+            result = run_script(name, script, str(project_path), args.url, in_process)
             results.append(result)
     
     # Print summary
@@ -10,12 +10,15 @@ Usage:
     python .agent/scripts/session_manager.py info [path]
 """
 
-import os
+import sys
 import json
 import argparse
 from pathlib import Path
 from typing import Dict, Any, List
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / ".shared" / "audit-kit"))
+from file_index import project_files
+
 def get_project_root(path: str) -> Path:
     return Path(path).resolve()
 
@@ -57,10 +60,7 @@ def count_files(root: Path) -> Dict[str, int]:
     stats = {"created": 0, "modified": 0, "total": 0}
     # Simple count for now, comprehensive tracking would require git diff or extensive history
     exclude = {".git", "node_modules", ".next", "dist", "build", ".agent", ".gemini", "__pycache__"}
-    
-    for root_dir, dirs, files in os.walk(root):
-        dirs[:] = [d for d in dirs if d not in exclude]
-        stats["total"] += len(files)
+    stats["total"] = len(project_files(root, skip_dirs=exclude))
         
     return stats
 
@@ -8,6 +8,7 @@ Use this before deployment or major releases.
 
 Usage:
     python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> --jobs 4   # run independent checks in parallel
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -25,10 +26,15 @@ Includes ALL checks:
 import sys
 import subprocess
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / ".shared" / "audit-kit"))
+from result_cache import configure_verify_cache
+from checker_runner import load_checker, run_in_process
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -57,6 +63,9 @@ def print_warning(text: str):
 def print_error(text: str):
     print(f"{Colors.RED}❌ {text}{Colors.ENDC}")
 
+# Per-check time limit (subprocess and in-process checkers alike)
+CHECK_TIMEOUT = 600  # 10 minutes
+
 # Complete verification suite
 VERIFICATION_SUITE = [
     # P0: Security (CRITICAL)
@@ -112,9 +121,11 @@ VERIFICATION_SUITE = [
     },
     
     # P6: Performance (requires URL)
+    # exclusive: measures the live URL, so never runs alongside other checks
     {
         "category": "Performance",
         "requires_url": True,
+        "exclusive": True,
         "checks": [
             ("Lighthouse Audit", ".agent/skills/performance-profiling/scripts/lighthouse_audit.py", True),
             ("Bundle Analysis", ".agent/skills/performance-profiling/scripts/bundle_analyzer.py", False),
@@ -125,6 +136,7 @@ VERIFICATION_SUITE = [
     {
         "category": "E2E Testing",
         "requires_url": True,
+        "exclusive": True,
         "checks": [
             ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
         ]
@@ -147,8 +159,8 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None, in_process: bool = True) -> dict:
+    """Run validation script (in this process when it exposes run_check, otherwise as a subprocess)"""
     if not script_path.exists():
         print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "skipped": True, "duration": 0}
@@ -156,6 +168,8 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     print_step(f"Running: {name}")
     start_time = datetime.now()
     
+    check = load_checker(script_path) if in_process else None
+    
     # Build command
     cmd = ["python", str(script_path), project_path]
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
@@ -163,33 +177,38 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     
     # Run
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
+        if check:
+            result = run_in_process(check, project_path, timeout=CHECK_TIMEOUT)
+        else:
+            process = subprocess.run(
+                cmd,
+                capture_output=True,
+                text=True,
+                timeout=CHECK_TIMEOUT
+            )
+            result = {"passed": process.returncode == 0, "output": process.stdout, "error": process.stderr, "data": None}
         
         duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
+        passed = result["passed"]
         
         if passed:
             print_success(f"{name}: PASSED ({duration:.1f}s)")
         else:
             print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
+            if result["error"]:
+                print(f"  {result['error'][:300]}")
         
         return {
             "name": name,
             "passed": passed,
-            "output": result.stdout,
-            "error": result.stderr,
+            "output": result["output"],
+            "error": result["error"],
+            "data": result["data"],
             "skipped": False,
             "duration": duration
         }
     
-    except subprocess.TimeoutExpired:
+    except (subprocess.TimeoutExpired, TimeoutError):
         duration = (datetime.now() - start_time).total_seconds()
         print_error(f"{name}: TIMEOUT (>{duration:.0f}s)")
         return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": "Timeout"}
@@ -199,6 +218,100 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
 
+def plan_checks(project_path: Path, url: Optional[str], no_e2e: bool) -> List[dict]:
+    """Flatten VERIFICATION_SUITE into the checks to run, in P0..P9 order"""
+    checks = []
+    for priority, suite in enumerate(VERIFICATION_SUITE):
+        category = suite["category"]
+        
+        # Skip if requires URL and not provided
+        if suite.get("requires_url", False) and not url:
+            continue
+        
+        # Skip E2E if flag set
+        if no_e2e and category == "E2E Testing":
+            continue
+        
+        for name, script_path, required in suite["checks"]:
+            checks.append({
+                "priority": priority,
+                "category": category,
+                "name": name,
+                "script": project_path / script_path,
+                "required": required,
+                "exclusive": suite.get("exclusive", False),
+            })
+    return checks
+
+def run_pooled(*args) -> dict:
+    """run_script in a pool worker, flushing its progress lines so they stream"""
+    try:
+        return run_script(*args)
+    finally:
+        sys.stdout.flush()
+
+def is_critical_failure(check: dict, result: dict) -> bool:
+    return check["required"] and not result["passed"] and not result.get("skipped")
+
+def run_parallel(checks: List[dict], project_path: Path, url: Optional[str], in_process: bool,
+                 jobs: int, stop_on_fail: bool) -> Tuple[List[dict], Optional[str]]:
+    """
+    Run independent checks on a pool of `jobs` workers, streaming each result
+    as it finishes. Exclusive checks (performance, E2E) run one at a time
+    afterwards. Results come back in P0..P9 order, together with the name of
+    the critical check that stopped the run (if any).
+    
+    In-process checkers are CPU-bound Python, so they get worker processes
+    (threads would share one GIL); subprocess checks only wait, so threads do.
+    """
+    results = {}
+    
+    def record(i: int, result: dict) -> Optional[str]:
+        result["category"] = checks[i]["category"]
+        results[i] = result
+        if stop_on_fail and is_critical_failure(checks[i], result):
+            return checks[i]["name"]
+        return None
+    
+    def outcome(future, i: int) -> dict:
+        try:
+            return future.result()
+        except Exception as e:  # the worker process died
+            print_error(f"{checks[i]['name']}: ERROR - {str(e)}")
+            return {"name": checks[i]["name"], "passed": False, "skipped": False, "duration": 0, "error": str(e)}
+    
+    stopped_by = None
+    pooled = [i for i, c in enumerate(checks) if not c["exclusive"]]
+    executor = ProcessPoolExecutor if in_process else ThreadPoolExecutor
+    with executor(max_workers=jobs) as pool:
+        futures = {
+            pool.submit(run_pooled, checks[i]["name"], checks[i]["script"], str(project_path), url, in_process): i
+            for i in pooled
+        }
+        for future in as_completed(futures):
+            stopped_by = record(futures[future], outcome(future, futures[future]))
+            if stopped_by:
+                # Fail fast: nothing new starts, checks already running finish
+                for pending in futures:
+                    pending.cancel()
+                running = sum(1 for f in futures if not f.done() and not f.cancelled())
+                if running:
+                    print_warning(f"Waiting for {running} running check(s) to finish...")
+                break
+        if stopped_by:
+            for future, i in futures.items():
+                if not future.cancelled():
+                    record(i, outcome(future, i))
+    
+    if not stopped_by:
+        for i, check in enumerate(checks):
+            if check["exclusive"]:
+                stopped_by = record(i, run_script(check["name"], check["script"], str(project_path), url, in_process))
+                if stopped_by:
+                    break
+    
+    return [results[i] for i in sorted(results)], stopped_by
+
 def print_final_report(results: List[dict], start_time: datetime):
     """Print comprehensive final report"""
     total_duration = (datetime.now() - start_time).total_seconds()
@@ -268,12 +381,16 @@ def main():
 Examples:
   python scripts/verify_all.py . --url http://localhost:3000
   python scripts/verify_all.py . --url https://staging.example.com --no-e2e
+  python scripts/verify_all.py . --url http://localhost:3000 --jobs 4
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
     parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Checks to run in parallel (default: 1, serial)")
+    parser.add_argument("--subprocess", action="store_true", help="Run every checker in its own Python process")
+    parser.add_argument("--no-cache", action="store_true", help="Re-analyze every file (ignore the per-file result cache)")
     
     args = parser.parse_args()
     
@@ -283,6 +400,9 @@ Examples:
         print_error(f"Project path does not exist: {project_path}")
         sys.exit(1)
     
+    configure_verify_cache(project_path, enabled=not args.no_cache)
+    in_process = not args.subprocess
+    
     print_header("🚀 ANTIGRAVITY KIT - FULL VERIFICATION SUITE")
     print(f"Project: {project_path}")
     print(f"URL: {args.url}")
@@ -290,33 +410,33 @@ Examples:
     
     start_time = datetime.now()
     results = []
+    checks = plan_checks(project_path, args.url, args.no_e2e)
     
-    # Run all verification categories
-    for suite in VERIFICATION_SUITE:
-        category = suite["category"]
-        requires_url = suite.get("requires_url", False)
-        
-        # Skip if requires URL and not provided
-        if requires_url and not args.url:
-            continue
-        
-        # Skip E2E if flag set
-        if args.no_e2e and category == "E2E Testing":
-            continue
-        
-        print_header(f"📋 {category.upper()}")
-        
-        for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
+    if args.jobs > 1:
+        print_header(f"📋 RUNNING {len(checks)} CHECKS ({args.jobs} PARALLEL)")
+        results, stopped_by = run_parallel(checks, project_path, args.url, in_process, args.jobs, args.stop_on_fail)
+    else:
+        # Run all verification categories in priority order
+        stopped_by = None
+        current_category = None
+        for check in checks:
+            if check["category"] != current_category:
+                current_category = check["category"]
+                print_header(f"📋 {current_category.upper()}")
+            
+            result = run_script(check["name"], check["script"], str(project_path), args.url, in_process)
+            result["category"] = current_category
             results.append(result)
             
             # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+            if args.stop_on_fail and is_critical_failure(check, result):
+                stopped_by = check["name"]
+                break
+    
+    if stopped_by:
+        print_error(f"CRITICAL: {stopped_by} failed. Stopping verification.")
+        print_final_report(results, start_time)
+        sys.exit(1)
     
     # Print final report
     all_passed = print_final_report(results, start_time)
@@ -6,8 +6,13 @@ Validates OpenAPI specs, response formats, and common issues.
 import sys
 import json
 import re
+from fnmatch import fnmatchcase
 from pathlib import Path
 
+# Shared audit helpers (.agent/.shared/audit-kit)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from file_index import project_files
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -15,21 +20,25 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+# (parent directory or None for any depth, file name glob)
+API_FILE_PATTERNS = [
+    (None, "*api*.ts"), (None, "*api*.js"), (None, "*api*.py"),
+    ("routes", "*.ts"), ("routes", "*.js"), ("routes", "*.py"),
+    ("controllers", "*.ts"), ("controllers", "*.js"),
+    ("endpoints", "*.ts"), ("endpoints", "*.py"),
+    (None, "*.openapi.json"), (None, "*.openapi.yaml"),
+    (None, "swagger.json"), (None, "swagger.yaml"),
+    (None, "openapi.json"), (None, "openapi.yaml")
+]
+
 def find_api_files(project_path: Path) -> list:
     """Find API-related files."""
-    patterns = [
-        "**/*api*.ts", "**/*api*.js", "**/*api*.py",
-        "**/routes/*.ts", "**/routes/*.js", "**/routes/*.py",
-        "**/controllers/*.ts", "**/controllers/*.js",
-        "**/endpoints/*.ts", "**/endpoints/*.py",
-        "**/*.openapi.json", "**/*.openapi.yaml",
-        "**/swagger.json", "**/swagger.yaml",
-        "**/openapi.json", "**/openapi.yaml"
-    ]
+    entries = project_files(project_path)
     
     files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+    for parent, name_glob in API_FILE_PATTERNS:
+        files.extend(e.path for e in entries
+                     if fnmatchcase(e.name, name_glob) and (parent is None or e.dirs[-1:] == (parent,)))
     
     # Exclude node_modules, etc.
     return [f for f in files if not any(x in str(f) for x in ['node_modules', '.git', 'dist', 'build', '__pycache__'])]
@@ -19,6 +19,10 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared audit helpers (.agent/.shared/audit-kit)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from file_index import project_files
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -30,13 +34,15 @@ def find_schema_files(project_path: Path) -> list:
     """Find database schema files."""
     schemas = []
     
+    entries = project_files(project_path)
+    
     # Prisma schema
-    prisma_files = list(project_path.glob('**/prisma/schema.prisma'))
+    prisma_files = [e.path for e in entries if e.name == 'schema.prisma' and e.dirs[-1:] == ('prisma',)]
     schemas.extend([('prisma', f) for f in prisma_files])
     
     # Drizzle schema files
-    drizzle_files = list(project_path.glob('**/drizzle/*.ts'))
-    drizzle_files.extend(project_path.glob('**/schema/*.ts'))
+    drizzle_files = [e.path for e in entries if e.suffix == '.ts' and e.dirs[-1:] == ('drizzle',)]
+    drizzle_files.extend(e.path for e in entries if e.suffix == '.ts' and e.dirs[-1:] == ('schema',))
     for f in drizzle_files:
         if 'schema' in f.name.lower() or 'table' in f.name.lower():
             schemas.append(('drizzle', f))
@@ -91,8 +97,9 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def run_check(project_path) -> dict:
+    """Validate every schema file; prints the report and returns the JSON summary."""
+    project_path = Path(project_path).resolve()
     
     print(f"\n{'='*60}")
     print(f"[SCHEMA VALIDATOR] Database Schema Validation")
@@ -115,7 +122,7 @@ def main():
             "message": "No schema files found"
         }
         print(json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
     # Validate each schema
     all_issues = []
@@ -165,7 +172,12 @@ def main():
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0)
+    return output
+
+def main():
+    project_path = sys.argv[1] if len(sys.argv) > 1 else "."
+    result = run_check(project_path)
+    sys.exit(0 if result["passed"] else 1)
 
 
 if __name__ == "__main__":
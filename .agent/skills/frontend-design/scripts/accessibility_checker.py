@@ -20,6 +20,12 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared audit helpers (.agent/.shared/audit-kit)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from content_cache import SkippedFile, guard_salt, read_text
+from file_index import project_files
+from result_cache import FileResultCache, script_fingerprint
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -29,14 +35,13 @@ except:
 
 def find_html_files(project_path: Path) -> list:
     """Find all HTML/JSX/TSX files."""
-    patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
+    suffixes = ['.html', '.jsx', '.tsx']
     skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
+    entries = project_files(project_path, suffixes=suffixes, skip_dirs=skip_dirs)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
-                files.append(f)
+    for suffix in suffixes:
+        files.extend(entry.path for entry in entries if entry.suffix == suffix)
     
     return files[:50]
 
@@ -46,7 +51,7 @@ def check_accessibility(file_path: Path) -> list:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path, guard=True)
         
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
@@ -102,14 +107,17 @@ def check_accessibility(file_path: Path) -> list:
                     issues.append("role='button' without tabindex")
                     break
         
+    except SkippedFile:
+        pass  # binary, minified or oversized: nothing to audit
     except Exception as e:
         issues.append(f"Error reading file: {str(e)[:50]}")
     
     return issues
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def run_check(project_path) -> dict:
+    """Audit every HTML/JSX/TSX file; prints the report and returns the JSON summary."""
+    project_path = Path(project_path).resolve()
     
     print(f"\n{'='*60}")
     print(f"[ACCESSIBILITY CHECKER] WCAG Compliance Audit")
@@ -132,18 +140,20 @@ def main():
             "message": "No HTML files found"
         }
         print(json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
-    # Check each file
+    # Check each file (unchanged files are served from the verify cache)
+    cache = FileResultCache("accessibility_checker", project_path, salt=script_fingerprint(__file__) + guard_salt())
     all_issues = []
     
     for f in files:
-        issues = check_accessibility(f)
+        issues = cache.get_or_compute(f, lambda: check_accessibility(f))
         if issues:
             all_issues.append({
                 "file": str(f.name),
                 "issues": issues
             })
+    cache.save()
     
     # Summary
     print("\n" + "="*60)
@@ -176,7 +186,12 @@ def main():
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    return output
+
+def main():
+    project_path = sys.argv[1] if len(sys.argv) > 1 else "."
+    result = run_check(project_path)
+    sys.exit(0 if result["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -21,6 +21,12 @@ import re
 import json
 from pathlib import Path
 
+# Shared audit helpers (.agent/.shared/audit-kit)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from content_cache import read_text
+from file_index import project_files
+from result_cache import FileResultCache, script_fingerprint
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -80,18 +86,15 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_web_pages(project_path: Path) -> list:
     """Find public-facing web pages only."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+    suffixes = ['.html', '.htm', '.jsx', '.tsx']
+    entries = project_files(project_path, suffixes=suffixes, skip_dirs=SKIP_DIRS)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
+    for suffix in suffixes:
+        for entry in entries:
             # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+            if entry.suffix == suffix and is_page_file(entry.path):
+                files.append(entry.path)
     
     return files[:30]  # Limit to 30 pages
 
@@ -99,7 +102,7 @@ def find_web_pages(project_path: Path) -> list:
 def check_page(file_path: Path) -> dict:
     """Check a single web page for GEO elements."""
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
     except Exception as e:
         return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
@@ -219,9 +222,9 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    target_path = Path(target).resolve()
+def run_check(project_path) -> dict:
+    """Score every public page for AI citation readiness; prints the report and returns the JSON summary."""
+    target_path = Path(project_path).resolve()
     
     print("\n" + "=" * 60)
     print("  GEO CHECKER - AI Citation Readiness Audit")
@@ -238,15 +241,17 @@ def main():
         print("    Skipping: docs, tests, config files, node_modules")
         output = {"script": "geo_checker", "pages_found": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
     print(f"Found {len(pages)} public pages to analyze\n")
     
-    # Check each page
+    # Check each page (unchanged files are served from the verify cache)
+    cache = FileResultCache("geo_checker", target_path, salt=script_fingerprint(__file__))
     results = []
     for page in pages:
-        result = check_page(page)
+        result = cache.get_or_compute(page, lambda: check_page(page))
         results.append(result)
+    cache.save()
     
     # Print results
     for result in results:
@@ -282,7 +287,12 @@ def main():
     }
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if avg_score >= 60 else 1)
+    return output
+
+def main():
+    project_path = sys.argv[1] if len(sys.argv) > 1 else "."
+    result = run_check(project_path)
+    sys.exit(0 if result["passed"] else 1)
 
 
 if __name__ == "__main__":
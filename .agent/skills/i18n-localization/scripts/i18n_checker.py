@@ -8,6 +8,12 @@ import re
 import json
 from pathlib import Path
 
+# Shared audit helpers (.agent/.shared/audit-kit)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from content_cache import guard_salt, read_text
+from file_index import project_files
+from result_cache import FileResultCache, script_fingerprint
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -52,18 +58,20 @@ I18N_PATTERNS = [
 
 def find_locale_files(project_path: Path) -> list:
     """Find translation/locale files."""
+    entries = project_files(project_path, suffixes={".json", ".po"})
+    # Same selection as the glob patterns "**/locales/**/*.json", ..., "**/messages/*.json", "**/*.po"
     patterns = [
-        "**/locales/**/*.json",
-        "**/translations/**/*.json",
-        "**/lang/**/*.json",
-        "**/i18n/**/*.json",
-        "**/messages/*.json",
-        "**/*.po",  # gettext
+        lambda e: e.suffix == ".json" and "locales" in e.dirs,
+        lambda e: e.suffix == ".json" and "translations" in e.dirs,
+        lambda e: e.suffix == ".json" and "lang" in e.dirs,
+        lambda e: e.suffix == ".json" and "i18n" in e.dirs,
+        lambda e: e.suffix == ".json" and e.dirs[-1:] == ("messages",),
+        lambda e: e.suffix == ".po",  # gettext
     ]
     
     files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+    for matches in patterns:
+        files.extend(e.path for e in entries if matches(e))
     
     return [f for f in files if 'node_modules' not in str(f)]
 
@@ -128,6 +136,23 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
+def analyze_code_file(file_path: Path, file_type: str) -> dict:
+    """i18n usage and hardcoded-string examples (one per matching pattern) for one file."""
+    content = read_text(file_path, guard=True)
+    
+    # Check for i18n usage
+    has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
+    
+    # Check for hardcoded strings
+    examples = []
+    if not has_i18n:
+        for pattern in HARDCODED_PATTERNS.get(file_type, []):
+            matches = re.findall(pattern, content)
+            if matches:
+                examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
+    
+    return {'has_i18n': has_i18n, 'examples': examples}
+
 def check_hardcoded_strings(project_path: Path) -> dict:
     """Check for hardcoded strings in code files."""
     issues = []
@@ -140,9 +165,10 @@ def check_hardcoded_strings(project_path: Path) -> dict:
         '.py': 'python'
     }
     
+    entries = project_files(project_path, suffixes=extensions)
     code_files = []
     for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+        code_files.extend(e.path for e in entries if e.suffix == ext)
     
     code_files = [f for f in code_files if not any(x in str(f) for x in 
                   ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
@@ -154,33 +180,22 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     files_with_hardcoded = 0
     hardcoded_examples = []
     
+    cache = FileResultCache("i18n_checker", project_path, salt=script_fingerprint(__file__) + guard_salt())
     for file_path in code_files[:50]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
+            file_type = extensions.get(file_path.suffix, 'jsx')
+            result = cache.get_or_compute(file_path, lambda: analyze_code_file(file_path, file_type))
             
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
+            if result['has_i18n']:
                 files_with_i18n += 1
             
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
-            
-            if hardcoded_found:
+            if result['examples']:
                 files_with_hardcoded += 1
+                hardcoded_examples.extend(result['examples'][:5 - len(hardcoded_examples)])
                 
         except:
             continue
+    cache.save()
     
     passed.append(f"[OK] Analyzed {len(code_files)} code files")
     
@@ -196,9 +211,9 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     
     return {'passed': passed, 'issues': issues}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
+def run_check(project_path) -> dict:
+    """Audit locale files and hardcoded strings; prints the report and returns the results."""
+    project_path = Path(project_path)
     
     print("\n" + "=" * 60)
     print("  i18n CHECKER - Internationalization Audit")
@@ -232,10 +247,20 @@ def main():
     print("\n" + "=" * 60)
     if critical_issues == 0:
         print("[OK] i18n CHECK: PASSED")
-        sys.exit(0)
     else:
         print(f"[X] i18n CHECK: {critical_issues} issues found")
-        sys.exit(1)
+    
+    return {
+        "passed": critical_issues == 0,
+        "critical_issues": critical_issues,
+        "locales": locale_result,
+        "code": code_result,
+    }
+
+def main():
+    target = sys.argv[1] if len(sys.argv) > 1 else "."
+    result = run_check(target)
+    sys.exit(0 if result["passed"] else 1)
 
 if __name__ == "__main__":
     main()
@@ -101,8 +101,9 @@ def run_linter(linter: dict, cwd: Path) -> dict:
     return result
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def run_check(project_path) -> dict:
+    """Run every detected linter; prints the report and returns the JSON summary."""
+    project_path = Path(project_path).resolve()
     
     print(f"\n{'='*60}")
     print(f"[LINT RUNNER] Unified Linting")
@@ -127,7 +128,7 @@ def main():
             "message": "No linters configured"
         }
         print(json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
     # Run each linter
     results = []
@@ -165,7 +166,12 @@ def main():
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if all_passed else 1)
+    return output
+
+def main():
+    project_path = sys.argv[1] if len(sys.argv) > 1 else "."
+    result = run_check(project_path)
+    sys.exit(0 if result["passed"] else 1)
 
 
 if __name__ == "__main__":
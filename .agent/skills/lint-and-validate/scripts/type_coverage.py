@@ -8,6 +8,12 @@ import re
 import subprocess
 from pathlib import Path
 
+# Shared audit helpers (.agent/.shared/audit-kit)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from content_cache import guard_salt, read_text
+from file_index import project_files
+from result_cache import FileResultCache, script_fingerprint
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -15,40 +21,63 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
+def analyze_typescript_file(file_path: Path) -> dict:
+    """Count 'any' usage and typed/untyped functions in one TypeScript file."""
+    content = read_text(file_path, guard=True)
+    
+    # Count 'any' usage
+    any_matches = re.findall(r':\s*any\b', content)
+    
+    # Find functions without return types
+    # function name(params) { - no return type
+    untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
+    # Arrow functions without types: const fn = (x) => or (x) =>
+    untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
+    
+    # Count typed functions
+    typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
+    typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
+    
+    return {'any_count': len(any_matches), 'untyped_functions': len(untyped), 'total_functions': len(typed) + len(untyped)}
+
+def analyze_python_file(file_path: Path) -> dict:
+    """Count 'Any' usage and typed/untyped functions in one Python file."""
+    content = read_text(file_path, guard=True)
+    
+    # Count Any usage
+    any_matches = re.findall(r':\s*Any\b', content)
+    
+    # Find functions with type hints
+    typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
+    typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
+    
+    # Find functions without type hints
+    all_funcs = re.findall(r'def\s+\w+\s*\(', content)
+    
+    return {'any_count': len(any_matches), 'typed_functions': len(typed_funcs), 'untyped_functions': len(all_funcs) - len(typed_funcs)}
+
 def check_typescript_coverage(project_path: Path) -> dict:
     """Check TypeScript type coverage."""
     issues = []
     passed = []
     stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
+    entries = project_files(project_path, suffixes={".ts", ".tsx"})
+    ts_files = [e.path for e in entries if e.suffix == ".ts"] + [e.path for e in entries if e.suffix == ".tsx"]
     ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
     
     if not ts_files:
         return {'type': 'typescript', 'files': 0, 'passed': [], 'issues': ["[!] No TypeScript files found"], 'stats': stats}
     
+    cache = FileResultCache("type_coverage-ts", project_path, salt=script_fingerprint(__file__) + guard_salt())
     for file_path in ts_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count 'any' usage
-            any_matches = re.findall(r':\s*any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions without return types
-            # function name(params) { - no return type
-            untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
-            # Arrow functions without types: const fn = (x) => or (x) =>
-            untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
-            stats['untyped_functions'] += len(untyped)
-            
-            # Count typed functions
-            typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
-            typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
-            stats['total_functions'] += len(typed) + len(untyped)
-            
+            counts = cache.get_or_compute(file_path, lambda: analyze_typescript_file(file_path))
+            for key in stats:
+                stats[key] += counts[key]
         except Exception:
             continue
+    cache.save()
     
     # Analyze results
     if stats['any_count'] == 0:
@@ -77,31 +106,21 @@ def check_python_coverage(project_path: Path) -> dict:
     passed = []
     stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
     
-    py_files = list(project_path.rglob("*.py"))
+    py_files = [e.path for e in project_files(project_path, suffixes={".py"})]
     py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
     
     if not py_files:
         return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
     
+    cache = FileResultCache("type_coverage-py", project_path, salt=script_fingerprint(__file__) + guard_salt())
     for file_path in py_files[:30]:  # Limit
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count Any usage
-            any_matches = re.findall(r':\s*Any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions with type hints
-            typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
-            typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
-            stats['typed_functions'] += len(typed_funcs)
-            
-            # Find functions without type hints
-            all_funcs = re.findall(r'def\s+\w+\s*\(', content)
-            stats['untyped_functions'] += len(all_funcs) - len(typed_funcs)
-            
+            counts = cache.get_or_compute(file_path, lambda: analyze_python_file(file_path))
+            for key in stats:
+                stats[key] += counts[key]
         except Exception:
             continue
+    cache.save()
     
     total = stats['typed_functions'] + stats['untyped_functions']
     
@@ -125,9 +144,9 @@ def check_python_coverage(project_path: Path) -> dict:
     
     return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
 
-def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
-    project_path = Path(target)
+def run_check(project_path) -> dict:
+    """Check TypeScript and Python type coverage; prints the report and returns the results."""
+    project_path = Path(project_path)
     
     print("\n" + "=" * 60)
     print("  TYPE COVERAGE CHECKER")
@@ -147,7 +166,7 @@ def main():
     
     if not results:
         print("[!] No TypeScript or Python files found.")
-        sys.exit(0)
+        return {"passed": True, "critical_issues": 0, "results": []}
     
     # Print results
     critical_issues = 0
@@ -164,10 +183,15 @@ def main():
     print("\n" + "=" * 60)
     if critical_issues == 0:
         print("[OK] TYPE COVERAGE: ACCEPTABLE")
-        sys.exit(0)
     else:
         print(f"[X] TYPE COVERAGE: {critical_issues} critical issues")
-        sys.exit(1)
+    
+    return {"passed": critical_issues == 0, "critical_issues": critical_issues, "results": results}
+
+def main():
+    target = sys.argv[1] if len(sys.argv) > 1 else "."
+    result = run_check(target)
+    sys.exit(0 if result["passed"] else 1)
 
 if __name__ == "__main__":
     main()
@@ -69,9 +69,20 @@ import sys
 import os
 import re
 import json
+import argparse
 from pathlib import Path
 
-class MobileAuditor:
+# Shared audit helpers (.agent/.shared/audit-kit)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from content_cache import read_text
+from file_audit import FileAuditor
+
+class MobileAuditor(FileAuditor):
+    CHECKER = "mobile_audit"
+    SCRIPT = __file__
+    EXTENSIONS = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
+    SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', '.idea'}
+
     def __init__(self):
         self.issues = []
         self.warnings = []
@@ -80,8 +91,7 @@ class MobileAuditor:
 
     def audit_file(self, filepath: str) -> None:
         try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
+            content = read_text(filepath, errors='replace', guard=True)
         except:
             return
 
@@ -610,14 +620,6 @@ class MobileAuditor:
             # This is more of a configuration check, not code pattern
             self.passed_count += 1  # Hermes is default in RN 0.70+
 
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.ts', '.jsx', '.js', '.dart'}
-        for root, dirs, files in os.walk(directory):
-            dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next', 'ios', 'android', 'build', '.idea'}]
-            for file in files:
-                if Path(file).suffix in extensions:
-                    self.audit_file(os.path.join(root, file))
-
     def get_report(self):
         return {
             "files_checked": self.files_checked,
@@ -628,19 +630,15 @@ class MobileAuditor:
         }
 
 
-def main():
-    if len(sys.argv) < 2:
-        print("Usage: python mobile_audit.py <directory>")
-        sys.exit(1)
-
-    path = sys.argv[1]
-    is_json = "--json" in sys.argv
+def run_check(path, as_json: bool = False, jobs: int = 1) -> dict:
+    """Audit a file or directory; prints the report and returns it with a 'passed' flag."""
+    is_json = as_json
 
     auditor = MobileAuditor()
     if os.path.isfile(path):
         auditor.audit_file(path)
     else:
-        auditor.audit_directory(path)
+        auditor.audit_directory(path, jobs)
 
     report = auditor.get_report()
 
@@ -661,7 +659,19 @@ def main():
         status = "PASS" if report['compliant'] else "FAIL"
         print(f"STATUS: {status}")
 
-    sys.exit(0 if report['compliant'] else 1)
+    return dict(report, passed=report['compliant'])
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Mobile UX audit (React Native / Flutter)")
+    parser.add_argument("path", help="File or directory to audit")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    parser.add_argument("--jobs", "-j", type=int, default=1, help="Worker processes for a directory (0 = one per CPU)")
+    args = parser.parse_args()
+
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    result = run_check(args.path, as_json=args.json, jobs=jobs)
+    sys.exit(0 if result['passed'] else 1)
 
 
 if __name__ == "__main__":
@@ -7,176 +7,155 @@ Based on Vercel Engineering best practices
 
 import os
 import re
+import sys
 import json
 from pathlib import Path
 from typing import List, Dict, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from module_graph import DYNAMIC, REEXPORT, STATIC, module_graph
+
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next'}
+SCRIPT_SUFFIXES = {'.ts', '.tsx', '.js', '.jsx'}
+TS_SUFFIXES = {'.ts', '.tsx'}
+LARGE_COMPONENT_CHARS = 10000
+
+SEQUENTIAL_AWAIT_RE = re.compile(r'await\s+\w+.*?\n\s*await\s+\w+')
+INDEX_IMPORT_RE = re.compile(r"@/.*?/index$")
+COMPONENT_RE = re.compile(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)')
+
 class PerformanceChecker:
     def __init__(self, project_path: str):
         self.project_path = Path(project_path)
         self.issues = []
         self.warnings = []
         self.passed = []
+        self._graph = None
+
+    @property
+    def graph(self):
+        """Module graph of the project, built on first use and shared by every check."""
+        if self._graph is None:
+            self._graph = module_graph(self.project_path, skip_dirs=SKIP_DIRS)
+        return self._graph
 
     def check_waterfalls(self):
         """Check for sequential await patterns (Section 1)"""
         print("\n[*] Checking for waterfalls (sequential awaits)...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: multiple awaits in sequence without Promise.all
-                sequential_awaits = re.findall(r'await\s+\w+.*?\n\s*await\s+\w+', content)
-
-                if sequential_awaits:
-                    self.issues.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'CRITICAL',
-                        'issue': 'Sequential awaits detected (waterfall)',
-                        'fix': 'Use Promise.all() for parallel fetching',
-                        'section': '1-async-eliminating-waterfalls.md'
-                    })
-            except Exception as e:
-                continue
+        for module in self.graph.modules_with(SCRIPT_SUFFIXES):
+            # Pattern: multiple awaits in sequence without Promise.all
+            if SEQUENTIAL_AWAIT_RE.search(module.text):
+                self.issues.append({
+                    'file': module.rel,
+                    'type': 'CRITICAL',
+                    'issue': 'Sequential awaits detected (waterfall)',
+                    'fix': 'Use Promise.all() for parallel fetching',
+                    'section': '1-async-eliminating-waterfalls.md'
+                })
 
     def check_barrel_imports(self):
         """Check for barrel imports (Section 2)"""
         print("[*] Checking for barrel imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
-
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: import from index files or barrel exports
-                barrel_imports = re.findall(r"import.*from\s+['\"](@/.*?)/index['\"]", content)
-                barrel_imports += re.findall(r"import.*from\s+['\"]\.\.?/.*?['\"](?!.*?\.tsx?)", content)
-
-                if barrel_imports:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'CRITICAL',
-                        'issue': 'Potential barrel imports detected',
-                        'fix': 'Import directly from specific files',
-                        'section': '2-bundle-bundle-size-optimization.md'
-                    })
-            except Exception as e:
-                continue
+        graph = self.graph
+        for module in graph.modules_with(SCRIPT_SUFFIXES):
+            # Imports that resolve to a module re-exporting others, or name an index file
+            barrel_imports = [site for site in module.imports
+                              if site.kind in (STATIC, REEXPORT)
+                              and (INDEX_IMPORT_RE.search(site.spec)
+                                   or (site.target and graph.is_barrel(site.target)))]
+
+            if barrel_imports:
+                self.warnings.append({
+                    'file': module.rel,
+                    'type': 'CRITICAL',
+                    'issue': 'Potential barrel imports detected',
+                    'fix': 'Import directly from specific files',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
 
     def check_dynamic_imports(self):
         """Check if large components use dynamic imports (Section 2)"""
         print("[*] Checking for missing dynamic imports...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
+        for module in self.graph.modules_with(TS_SUFFIXES):
+            # Check file size - if > 10KB, should probably use dynamic import
+            if len(module.text) <= LARGE_COMPONENT_CHARS:
                 continue
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check file size - if > 10KB, should probably use dynamic import
-                if len(content) > 10000:
-                    # Check if it's imported statically somewhere
-                    filename = filepath.stem
-
-                    # Search for static imports of this component
-                    for check_file in self.project_path.rglob('*.{ts,tsx}'):
-                        if check_file == filepath or 'node_modules' in str(check_file):
-                            continue
-
-                        check_content = check_file.read_text(encoding='utf-8')
-                        if f"import {filename}" in check_content or f"import {{ {filename}" in check_content:
-                            if 'dynamic(' not in check_content:
-                                self.warnings.append({
-                                    'file': str(check_file.relative_to(self.project_path)),
-                                    'type': 'CRITICAL',
-                                    'issue': f'Large component {filename} imported statically',
-                                    'fix': 'Use dynamic() for code splitting',
-                                    'section': '2-bundle-bundle-size-optimization.md'
-                                })
-                                break
-            except Exception as e:
-                continue
+            # Static importers come straight from the graph's reverse index
+            for importer, site in self.graph.importers(module.rel, kinds=(STATIC,)):
+                if importer.suffix not in TS_SUFFIXES or importer is module:
+                    continue
+                if 'dynamic(' in importer.text:
+                    continue
+                if any(s.kind == DYNAMIC and s.target == module.rel for s in importer.imports):
+                    continue
+                self.warnings.append({
+                    'file': importer.rel,
+                    'type': 'CRITICAL',
+                    'issue': f'Large component {module.stem} imported statically',
+                    'fix': 'Use dynamic() for code splitting',
+                    'section': '2-bundle-bundle-size-optimization.md'
+                })
+                break
 
     def check_useEffect_fetching(self):
         """Check for data fetching in useEffect (Section 4)"""
         print("[*] Checking for useEffect data fetching...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
+        for module in self.graph.modules_with(TS_SUFFIXES):
+            content = module.text
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Pattern: fetch or axios in useEffect
-                if 'useEffect' in content:
-                    if re.search(r'useEffect.*?fetch\(', content, re.DOTALL):
-                        self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
-                            'type': 'MEDIUM-HIGH',
-                            'issue': 'Data fetching in useEffect',
-                            'fix': 'Consider using SWR or React Query for deduplication',
-                            'section': '4-client-client-side-data-fetching.md'
-                        })
-            except Exception as e:
-                continue
+            # Pattern: fetch after a useEffect
+            start = content.find('useEffect')
+            if start != -1 and content.find('fetch(', start + len('useEffect')) != -1:
+                self.warnings.append({
+                    'file': module.rel,
+                    'type': 'MEDIUM-HIGH',
+                    'issue': 'Data fetching in useEffect',
+                    'fix': 'Consider using SWR or React Query for deduplication',
+                    'section': '4-client-client-side-data-fetching.md'
+                })
 
     def check_missing_memoization(self):
         """Check for missing React.memo, useMemo, useCallback (Section 5)"""
         print("[*] Checking for missing memoization...")
 
-        for filepath in self.project_path.rglob('*.{tsx}'):
-            if 'node_modules' in str(filepath):
-                continue
+        for module in self.graph.modules_with({'.tsx'}):
+            content = module.text
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check for component definitions without memo
-                components = re.findall(r'(?:export\s+)?(?:const|function)\s+([A-Z]\w+)', content)
-
-                if components and 'React.memo' not in content and 'memo(' not in content:
-                    # Check if component receives props
-                    if 'props:' in content or 'Props>' in content:
-                        self.warnings.append({
-                            'file': str(filepath.relative_to(self.project_path)),
-                            'type': 'MEDIUM',
-                            'issue': 'Component with props not memoized',
-                            'fix': 'Consider using React.memo if props are stable',
-                            'section': '5-rerender-re-render-optimization.md'
-                        })
-            except Exception as e:
+            # Check for component definitions without memo
+            if 'React.memo' in content or 'memo(' in content or not COMPONENT_RE.search(content):
                 continue
 
+            # Check if component receives props
+            if 'props:' in content or 'Props>' in content:
+                self.warnings.append({
+                    'file': module.rel,
+                    'type': 'MEDIUM',
+                    'issue': 'Component with props not memoized',
+                    'fix': 'Consider using React.memo if props are stable',
+                    'section': '5-rerender-re-render-optimization.md'
+                })
+
     def check_image_optimization(self):
         """Check for unoptimized images (Section 6)"""
         print("[*] Checking for image optimization...")
 
-        for filepath in self.project_path.rglob('*.{ts,tsx,js,jsx}'):
-            if 'node_modules' in str(filepath):
-                continue
+        for module in self.graph.modules_with(SCRIPT_SUFFIXES):
+            content = module.text
 
-            try:
-                content = filepath.read_text(encoding='utf-8')
-
-                # Check for <img> tags instead of next/image
-                if '<img' in content and 'next/image' not in content:
-                    self.warnings.append({
-                        'file': str(filepath.relative_to(self.project_path)),
-                        'type': 'MEDIUM',
-                        'issue': 'Using <img> instead of next/image',
-                        'fix': 'Use next/image for automatic optimization',
-                        'section': '6-rendering-rendering-performance.md'
-                    })
-            except Exception as e:
-                continue
+            # Check for <img> tags instead of next/image
+            if '<img' in content and 'next/image' not in content:
+                self.warnings.append({
+                    'file': module.rel,
+                    'type': 'MEDIUM',
+                    'issue': 'Using <img> instead of next/image',
+                    'fix': 'Use next/image for automatic optimization',
+                    'section': '6-rendering-rendering-performance.md'
+                })
 
     def generate_report(self):
         """Generate final report"""
@@ -221,6 +200,9 @@ class PerformanceChecker:
         print("="*60)
         print(f"Scanning: {self.project_path}")
 
+        modules = self.graph.modules_with()
+        print(f"Indexed {len(modules)} modules ({sum(m.size for m in modules) / 1024:.1f} KB)")
+
         self.check_waterfalls()
         self.check_barrel_imports()
         self.check_dynamic_imports()
@@ -232,8 +214,6 @@ class PerformanceChecker:
 
 
 def main():
-    import sys
-
     if len(sys.argv) < 2:
         print("Usage: python react_performance_checker.py <project_path>")
         sys.exit(1)
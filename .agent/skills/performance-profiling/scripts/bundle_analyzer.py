@@ -0,0 +1,450 @@
+#!/usr/bin/env python3
+"""
+Skill: performance-profiling
+Script: bundle_analyzer.py
+Purpose: Static bundle-weight analysis of a Vite build (dist/)
+Usage: python bundle_analyzer.py <project_path> [--dist dist] [--json] [--output report.json]
+                                                [--budget chunk_gzip_kb=200 ...]
+Output: Per-chunk and per-source-module raw/gzip/brotli sizes, large JSON
+        imports and budget violations (exit code 1 when a budget is exceeded)
+Note: Run `npm run build` first. Per-module attribution needs sourcemaps
+      (build.sourcemap: true); the chunk graph uses dist/.vite/manifest.json
+      (build.manifest: true) and falls back to index.html + chunk imports.
+      Brotli sizes need the optional `brotli` package (pip install brotli).
+"""
+import argparse
+import json
+import os
+import posixpath
+import re
+import sys
+import zlib
+from pathlib import Path
+from typing import Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from module_graph import STATIC, REEXPORT, module_graph
+
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Budgets in KB; override with --budget name=value
+DEFAULT_BUDGETS = {
+    "chunk_gzip_kb": 200,       # any single JS chunk, gzipped
+    "initial_gzip_kb": 300,     # JS + CSS loaded by index.html before any lazy chunk, gzipped
+    "json_module_kb": 50,       # a JSON file imported into the JS bundle (source size)
+}
+CODE_SUFFIXES = {'.js', '.mjs', '.css'}
+TEXT_SUFFIXES = CODE_SUFFIXES | {'.html', '.svg', '.json', '.txt', '.xml', '.map'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next'}
+TOP_MODULES = 15
+UNMAPPED = "(unmapped)"
+
+_VLQ_CHARS = {c: i for i, c in enumerate("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/")}
+_CHUNK_IMPORT_RE = re.compile(r"""(?:\bfrom|\bimport)\s*["'](\.{1,2}/[^"']+\.m?js)["']""")
+_CHUNK_DYNAMIC_RE = re.compile(r"""\bimport\s*\(\s*["'](\.{1,2}/[^"']+\.m?js)["']\s*\)""")
+_HTML_ASSET_RE = re.compile(r"""<(?:script|link)\b[^>]*?\b(?:src|href)\s*=\s*["']([^"']+)["'][^>]*>""", re.IGNORECASE)
+
+
+def compressed_sizes(data: bytes) -> Dict[str, Optional[int]]:
+    """raw / gzip -9 / brotli (None when the brotli package is missing) byte counts."""
+    gzip_size = len(zlib.compress(data, 9)) + 18 if data else 0   # + gzip header/trailer
+    brotli_size = len(brotli.compress(data)) if BROTLI_AVAILABLE and data else (0 if BROTLI_AVAILABLE else None)
+    return {"raw": len(data), "gzip": gzip_size, "brotli": brotli_size}
+
+
+def _scaled(sizes: Dict[str, Optional[int]], share: float) -> Dict[str, Optional[int]]:
+    return {k: (round(v * share) if v is not None else None) for k, v in sizes.items()}
+
+
+def _vlq_segments(line: str):
+    """Decode one ';'-separated line of source map mappings into lists of ints."""
+    for segment in line.split(","):
+        if not segment:
+            continue
+        values, shift, value = [], 0, 0
+        for char in segment:
+            digit = _VLQ_CHARS[char]
+            value += (digit & 31) << shift
+            if digit & 32:
+                shift += 5
+            else:
+                values.append(-(value >> 1) if value & 1 else value >> 1)
+                shift, value = 0, 0
+        yield values
+
+
+def attribute_sources(code: str, source_map: dict, map_dir: str) -> Dict[str, int]:
+    """
+    Characters of generated code per original source, walking the mappings:
+    each segment owns the text up to the next segment on its line.
+    """
+    root = source_map.get("sourceRoot") or ""
+    sources = [posixpath.normpath(posixpath.join(map_dir, root, s)) for s in source_map.get("sources", [])]
+    owned = {}
+    lines = code.split("\n")
+    source = 0
+    for line_no, mapping in enumerate(source_map.get("mappings", "").split(";")):
+        if line_no >= len(lines):
+            break
+        text_len = len(lines[line_no])
+        column = 0
+        spans = []
+        for values in _vlq_segments(mapping):
+            column += values[0]
+            if len(values) >= 4:
+                source += values[1]
+                spans.append((column, sources[source] if 0 <= source < len(sources) else UNMAPPED))
+            else:
+                spans.append((column, UNMAPPED))
+        if not spans:
+            owned[UNMAPPED] = owned.get(UNMAPPED, 0) + text_len
+            continue
+        if spans[0][0] > 0:
+            owned[UNMAPPED] = owned.get(UNMAPPED, 0) + spans[0][0]
+        for i, (start, name) in enumerate(spans):
+            end = spans[i + 1][0] if i + 1 < len(spans) else text_len
+            if end > start:
+                owned[name] = owned.get(name, 0) + end - start
+    return owned
+
+
+def package_of(source: str) -> Optional[str]:
+    """npm package a source path belongs to ('node_modules/@scope/pkg/x.js' -> '@scope/pkg')."""
+    parts = source.split("/")
+    if "node_modules" not in parts:
+        return None
+    idx = len(parts) - 1 - parts[::-1].index("node_modules")
+    rest = parts[idx + 1:]
+    if not rest:
+        return None
+    return "/".join(rest[:2]) if rest[0].startswith("@") and len(rest) > 1 else rest[0]
+
+
+class BundleAnalyzer:
+    def __init__(self, project_path: str, dist: str = "dist", budgets: Optional[Dict[str, float]] = None):
+        self.project_path = Path(project_path)
+        self.dist = self.project_path / dist
+        self.budgets = dict(DEFAULT_BUDGETS, **(budgets or {}))
+        self.chunks: List[dict] = []
+        self.assets: List[dict] = []
+        self.modules: Dict[str, dict] = {}
+        self.json_imports: List[dict] = []
+        self.violations: List[dict] = []
+        self.manifest = None
+        self.sourcemaps = 0
+
+    # ---- dist/ ---------------------------------------------------------
+
+    def _dist_rel(self, path: Path) -> str:
+        return path.relative_to(self.dist).as_posix()
+
+    def load_manifest(self) -> None:
+        for candidate in (self.dist / ".vite" / "manifest.json", self.dist / "manifest.json"):
+            if candidate.is_file():
+                try:
+                    self.manifest = json.loads(candidate.read_text(encoding="utf-8"))
+                except (OSError, ValueError):
+                    self.manifest = None
+                return
+
+    def scan_dist(self) -> None:
+        """Size every emitted file; attribute JS/CSS chunks to source modules via their sourcemaps."""
+        for path in sorted(self.dist.rglob("*")):
+            if not path.is_file() or path.suffix == ".map" or ".vite" in path.relative_to(self.dist).parts:
+                continue
+            rel = self._dist_rel(path)
+            data = path.read_bytes()
+            if path.suffix not in CODE_SUFFIXES:
+                sizes = compressed_sizes(data) if path.suffix in TEXT_SUFFIXES else {"raw": len(data), "gzip": None, "brotli": None}
+                self.assets.append(dict(file=rel, **sizes))
+                continue
+            code = data.decode("utf-8", errors="replace")
+            chunk = dict(file=rel, type="css" if path.suffix == ".css" else "js", kind="chunk",
+                         initial=False, imports=[], dynamic_imports=[], modules=[], **compressed_sizes(data))
+            if chunk["type"] == "js":
+                base = posixpath.dirname(rel)
+                chunk["imports"] = sorted({posixpath.normpath(posixpath.join(base, m)) for m in _CHUNK_IMPORT_RE.findall(code)})
+                chunk["dynamic_imports"] = sorted({posixpath.normpath(posixpath.join(base, m)) for m in _CHUNK_DYNAMIC_RE.findall(code)})
+            self._attribute(chunk, path, code)
+            self.chunks.append(chunk)
+
+    def _attribute(self, chunk: dict, path: Path, code: str) -> None:
+        map_path = path.with_name(path.name + ".map")
+        if not map_path.is_file():
+            return
+        try:
+            source_map = json.loads(map_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        self.sourcemaps += 1
+        # Source paths in the map are relative to the map file; report them relative to the project
+        map_dir = Path(os.path.relpath(path.parent, self.project_path)).as_posix()
+        owned = attribute_sources(code, source_map, map_dir)
+        total = sum(owned.values()) or 1
+        for source, chars in sorted(owned.items(), key=lambda item: -item[1]):
+            # Compressed sizes are apportioned by raw share: modules are not compressed in isolation
+            sizes = _scaled({"raw": chunk["raw"], "gzip": chunk["gzip"], "brotli": chunk["brotli"]}, chars / total)
+            chunk["modules"].append(dict(source=source, **sizes))
+            entry = self.modules.setdefault(source, {"source": source, "package": package_of(source),
+                                                     "raw": 0, "gzip": 0, "brotli": 0 if BROTLI_AVAILABLE else None,
+                                                     "chunks": []})
+            for key in ("raw", "gzip", "brotli"):
+                if entry[key] is not None and sizes[key] is not None:
+                    entry[key] += sizes[key]
+            entry["chunks"].append(chunk["file"])
+
+    def classify_chunks(self) -> None:
+        """Mark entry / lazy chunks and the initial set loaded by index.html."""
+        by_file = {c["file"]: c for c in self.chunks}
+        entries, lazy = set(), set()
+
+        if self.manifest:
+            for item in self.manifest.values():
+                chunk = by_file.get(item.get("file"))
+                if not chunk:
+                    continue
+                if item.get("src"):
+                    chunk["src"] = item["src"]
+                chunk["imports"] = sorted({self.manifest[k]["file"] for k in item.get("imports", []) if k in self.manifest} | set(item.get("css", [])))
+                chunk["dynamic_imports"] = sorted({self.manifest[k]["file"] for k in item.get("dynamicImports", []) if k in self.manifest})
+                if item.get("isEntry"):
+                    entries.add(chunk["file"])
+                if item.get("isDynamicEntry"):
+                    lazy.add(chunk["file"])
+        else:
+            html = self.dist / "index.html"
+            if html.is_file():
+                for ref in _HTML_ASSET_RE.findall(html.read_text(encoding="utf-8", errors="ignore")):
+                    ref = posixpath.normpath(ref.split("?")[0].lstrip("/"))
+                    if ref in by_file:
+                        entries.add(ref)
+            for chunk in self.chunks:
+                lazy.update(chunk["dynamic_imports"])
+            if not entries:
+                entries = {c["file"] for c in self.chunks if c["file"] not in lazy}
+
+        # Initial set: entries plus everything they import statically
+        stack = list(entries)
+        seen = set()
+        while stack:
+            name = stack.pop()
+            if name in seen or name not in by_file:
+                continue
+            seen.add(name)
+            stack.extend(by_file[name]["imports"])
+        for chunk in self.chunks:
+            chunk["initial"] = chunk["file"] in seen
+            chunk["kind"] = "entry" if chunk["file"] in entries else "lazy" if chunk["file"] in lazy else "chunk"
+
+    # ---- sources -------------------------------------------------------
+
+    def find_json_imports(self) -> None:
+        """JSON files imported from source, which chunks carry them and the import chains that pull them in."""
+        graph = module_graph(self.project_path, skip_dirs=SKIP_DIRS)
+        json_targets = {}
+        for module in graph.modules_with():
+            for site in module.imports:
+                if site.target and site.target.endswith(".json") and site.kind in (STATIC, REEXPORT):
+                    json_targets.setdefault(site.target, None)
+
+        for target in sorted(json_targets):
+            try:
+                size = (self.project_path / target).stat().st_size
+            except OSError:
+                continue
+            bundled = self.modules.get(target)
+            self.json_imports.append({
+                "source": target,
+                "size": size,
+                "bundled": {k: bundled[k] for k in ("raw", "gzip", "brotli")} if bundled else None,
+                "chunks": sorted(set(bundled["chunks"])) if bundled else [],
+                "pulled_in_by": self._component_chains(graph, target),
+            })
+
+    @staticmethod
+    def _component_chains(graph, target: str) -> List[str]:
+        """
+        Reverse static-import chains from target up to the first component
+        (.tsx/.jsx) module, e.g. 'components/QuoteForm.tsx -> products_data.ts'.
+        """
+        chains = []
+        stack = [(target, [])]
+        seen = {target}
+        while stack:
+            rel, path = stack.pop()
+            for importer, _ in graph.importers(rel, kinds=(STATIC, REEXPORT)):
+                chain = [importer.rel] + path
+                if importer.suffix in ('.tsx', '.jsx'):
+                    chains.append(" -> ".join(chain))
+                elif importer.rel not in seen:
+                    seen.add(importer.rel)
+                    importers = graph.importers(importer.rel, kinds=(STATIC, REEXPORT))
+                    if importers:
+                        stack.append((importer.rel, chain))
+                    else:
+                        chains.append(" -> ".join(chain))
+        return sorted(set(chains))
+
+    # ---- budgets -------------------------------------------------------
+
+    def check_budgets(self) -> None:
+        kb = 1024
+        limit = self.budgets["chunk_gzip_kb"] * kb
+        for chunk in self.chunks:
+            if chunk["type"] == "js" and chunk["gzip"] > limit:
+                self.violations.append({"budget": "chunk_gzip_kb", "target": chunk["file"],
+                                        "limit": limit, "actual": chunk["gzip"]})
+        initial = sum(c["gzip"] for c in self.chunks if c["initial"])
+        if self.chunks and initial > self.budgets["initial_gzip_kb"] * kb:
+            self.violations.append({"budget": "initial_gzip_kb", "target": "initial load",
+                                    "limit": self.budgets["initial_gzip_kb"] * kb, "actual": initial})
+        limit = self.budgets["json_module_kb"] * kb
+        for item in self.json_imports:
+            if item["size"] > limit:
+                self.violations.append({"budget": "json_module_kb", "target": item["source"],
+                                        "limit": limit, "actual": item["size"]})
+
+    # ---- report --------------------------------------------------------
+
+    def run(self) -> dict:
+        has_dist = self.dist.is_dir()
+        if has_dist:
+            self.load_manifest()
+            self.scan_dist()
+            self.classify_chunks()
+        self.find_json_imports()
+        self.check_budgets()
+        return self.get_report(has_dist)
+
+    def get_report(self, has_dist: bool = True) -> dict:
+        def total(items, key):
+            values = [i[key] for i in items if i[key] is not None]
+            return sum(values) if values or not items else None
+
+        initial = [c for c in self.chunks if c["initial"]]
+        modules = sorted(self.modules.values(), key=lambda m: -m["raw"])
+        packages = {}
+        for module in modules:
+            if module["package"]:
+                pkg = packages.setdefault(module["package"], {"package": module["package"], "raw": 0, "gzip": 0})
+                pkg["raw"] += module["raw"]
+                pkg["gzip"] += module["gzip"]
+        return {
+            "project": str(self.project_path),
+            "dist": str(self.dist) if has_dist else None,
+            "manifest": self.manifest is not None,
+            "sourcemaps": self.sourcemaps,
+            "brotli": BROTLI_AVAILABLE,
+            "totals": {key: total(self.chunks, key) for key in ("raw", "gzip", "brotli")},
+            "initial": dict({key: total(initial, key) for key in ("raw", "gzip", "brotli")},
+                            chunks=[c["file"] for c in initial]),
+            "chunks": sorted(self.chunks, key=lambda c: -c["raw"]),
+            "assets": sorted(self.assets, key=lambda a: -a["raw"]),
+            "modules": modules,
+            "packages": sorted(packages.values(), key=lambda p: -p["raw"]),
+            "json_imports": self.json_imports,
+            "budgets": self.budgets,
+            "violations": self.violations,
+            "passed": not self.violations,
+        }
+
+
+def _kb(value) -> str:
+    return "-" if value is None else f"{value / 1024:.1f} KB"
+
+
+def print_report(report: dict) -> None:
+    print("=" * 60)
+    print("BUNDLE ANALYSIS")
+    print("=" * 60)
+    if not report["dist"]:
+        print("[!] No build output found - run `npm run build` first (source checks only)")
+    else:
+        t, i = report["totals"], report["initial"]
+        print(f"Chunks: {len(report['chunks'])}  Manifest: {'yes' if report['manifest'] else 'no'}  "
+              f"Sourcemaps: {report['sourcemaps']}")
+        print(f"Total JS/CSS:  raw {_kb(t['raw'])}  gzip {_kb(t['gzip'])}  brotli {_kb(t['brotli'])}")
+        print(f"Initial load:  raw {_kb(i['raw'])}  gzip {_kb(i['gzip'])}  brotli {_kb(i['brotli'])}")
+
+        print("\n[CHUNKS]")
+        for chunk in report["chunks"][:10]:
+            flag = " (initial)" if chunk["initial"] else ""
+            print(f"  {chunk['file']}  [{chunk['kind']}{flag}]  raw {_kb(chunk['raw'])}  gzip {_kb(chunk['gzip'])}")
+
+        if report["modules"]:
+            print(f"\n[TOP MODULES] (of {len(report['modules'])})")
+            for module in report["modules"][:TOP_MODULES]:
+                print(f"  {module['source']}  raw {_kb(module['raw'])}  gzip ~{_kb(module['gzip'])}")
+        elif report["chunks"]:
+            print("\n[i] No sourcemaps - set build.sourcemap: true for per-module sizes")
+
+    if report["json_imports"]:
+        print("\n[JSON IMPORTS]")
+        for item in report["json_imports"]:
+            bundled = f", bundled gzip ~{_kb(item['bundled']['gzip'])}" if item["bundled"] else ""
+            print(f"  {item['source']}  ({_kb(item['size'])} source{bundled})")
+            for chain in item["pulled_in_by"]:
+                print(f"    <- {chain}")
+            if item["chunks"]:
+                print(f"    in chunks: {', '.join(item['chunks'])}")
+
+    print("\n" + "=" * 60)
+    if report["violations"]:
+        print(f"[X] {len(report['violations'])} budget violation(s):")
+        for v in report["violations"]:
+            print(f"  - {v['budget']}: {v['target']} is {_kb(v['actual'])} (limit {_kb(v['limit'])})")
+    else:
+        print("[OK] All bundle budgets met")
+
+
+def parse_budgets(values: List[str]) -> Dict[str, float]:
+    budgets = {}
+    for value in values or []:
+        name, sep, number = value.partition("=")
+        if not sep or name not in DEFAULT_BUDGETS:
+            raise ValueError(f"unknown budget '{value}' (expected one of {', '.join(DEFAULT_BUDGETS)} as name=KB)")
+        budgets[name] = float(number)
+    return budgets
+
+
+def run_check(project_path, dist: str = "dist", budgets: Optional[Dict[str, float]] = None,
+              as_json: bool = False, output: Optional[str] = None) -> dict:
+    """Analyze the build; prints the report and returns it with a 'passed' flag."""
+    report = BundleAnalyzer(project_path, dist, budgets).run()
+    if output:
+        Path(output).write_text(json.dumps(report, indent=2), encoding="utf-8")
+    if as_json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Static bundle-weight analyzer for Vite builds")
+    parser.add_argument("project", nargs="?", default=".", help="Project path (default: current directory)")
+    parser.add_argument("--dist", default="dist", help="Build output directory, relative to the project (default: dist)")
+    parser.add_argument("--json", action="store_true", help="Print the JSON report instead of the summary")
+    parser.add_argument("--output", help="Also write the JSON report to this file")
+    parser.add_argument("--budget", action="append", metavar="NAME=KB",
+                        help=f"Override a budget ({', '.join(f'{k}={v}' for k, v in DEFAULT_BUDGETS.items())})")
+    args = parser.parse_args()
+
+    if not os.path.isdir(args.project):
+        print(f"[ERROR] Path not found: {args.project}")
+        sys.exit(1)
+    try:
+        budgets = parse_budgets(args.budget)
+    except ValueError as e:
+        parser.error(str(e))
+
+    report = run_check(args.project, args.dist, budgets, args.json, args.output)
+    sys.exit(0 if report["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -3,22 +3,102 @@
 Skill: performance-profiling
 Script: lighthouse_audit.py
 Purpose: Run Lighthouse performance audit on a URL
-Usage: python lighthouse_audit.py https://example.com
-Output: JSON with performance scores
+Usage: python lighthouse_audit.py [project_path] https://example.com [--runs 5] [--preset mobile|desktop]
+                                  [--history .lighthouse-history.json] [--threshold 10]
+Output: JSON with performance scores and median/p90 per metric
 Note: Requires lighthouse CLI (npm install -g lighthouse)
+
+With --runs N the URL is audited N times in a row and every category score
+and metric (LCP, TBT, CLS, FCP, Speed Index, TTI) is reported as median and
+p90, so one noisy run can't pass or fail a gate. --history appends the
+medians to a JSON file together with the current git commit and compares
+them with the previous entry for the same URL and preset; a metric that got
+worse by more than --threshold percent is a regression (exit code 1).
+
+Multi-route mode audits several paths of one app and prints a per-route
+matrix. Routes come from --routes (comma list, or @file with one per line)
+and/or --discover, which reads <Route path> / { path: } entries from the
+React Router config and <loc> entries from public/ or dist/ sitemap.xml.
+Dynamic segments need a value (--param slug=my-post), splats are skipped.
+--serve serves the build (dist/ by default, SPA fallback to index.html) on
+a local port, so no URL is needed; its history entries are keyed by route
+("served:/about"), not by the random port. --concurrency bounds how many Lighthouse
+processes run at once; every process loads the CPU, so keep it low when
+comparing numbers between runs.
+
+    python lighthouse_audit.py . --serve --discover --param slug=hello --runs 3 --table
 """
+import argparse
+import functools
+import http.server
+import posixpath
+import re
 import subprocess
 import json
 import sys
 import os
+import statistics
 import tempfile
+import threading
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from module_graph import module_graph
+
+CATEGORIES = {
+    "performance": "performance",
+    "accessibility": "accessibility",
+    "best_practices": "best-practices",
+    "seo": "seo",
+}
+
+# metric -> Lighthouse audit id (numericValue: ms, except CLS which is unitless)
+METRICS = {
+    "lcp": "largest-contentful-paint",
+    "tbt": "total-blocking-time",
+    "cls": "cumulative-layout-shift",
+    "fcp": "first-contentful-paint",
+    "speed_index": "speed-index",
+    "tti": "interactive",
+}
 
-def run_lighthouse(url: str) -> dict:
-    """Run Lighthouse audit on URL."""
+# Throttling presets passed straight to the lighthouse CLI
+PRESETS = {
+    # Lighthouse's default mobile profile: Moto G Power on a slow 4G link
+    "mobile": [
+        "--form-factor=mobile",
+        "--throttling-method=simulate",
+        "--throttling.rttMs=150",
+        "--throttling.throughputKbps=1638.4",
+        "--throttling.cpuSlowdownMultiplier=4",
+    ],
+    "desktop": ["--preset=desktop"],
+}
+DEFAULT_PRESET = "mobile"
+DEFAULT_THRESHOLD = 10.0    # percent a median may worsen before it counts as a regression
+RUN_TIMEOUT = 120
+DEFAULT_CONCURRENCY = 2
+
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next'}
+SITEMAPS = ["public/sitemap.xml", "dist/sitemap.xml", "sitemap.xml"]
+_ROUTE_TAG_RE = re.compile(r"<Route\b|</Route\s*>")
+_PATH_ATTR_RE = re.compile(r"""\bpath\s*=\s*(?:["']([^"']*)["']|\{\s*["'`]([^"'`]*)["'`]\s*\})""")
+_INDEX_ATTR_RE = re.compile(r"\bindex\b(?!\s*=\s*\{\s*false)")
+_OBJECT_PATH_RE = re.compile(r"""\bpath\s*:\s*["'`](/[^"'`]*)["'`]""")
+_LOC_RE = re.compile(r"<loc>\s*([^<\s]+)\s*</loc>", re.IGNORECASE)
+_PARAM_RE = re.compile(r":(\w+)\??")
+
+
+def lighthouse_report(url: str, preset: str = DEFAULT_PRESET) -> dict:
+    """One Lighthouse run; the raw JSON report, or {'error': ...}."""
     try:
         with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
             output_path = f.name
-        
+
         result = subprocess.run(
             [
                 "lighthouse",
@@ -27,39 +107,102 @@ def run_lighthouse(url: str) -> dict:
                 f"--output-path={output_path}",
                 "--chrome-flags=--headless",
                 "--only-categories=performance,accessibility,best-practices,seo"
-            ],
+            ] + PRESETS[preset],
             capture_output=True,
             text=True,
-            timeout=120
+            timeout=RUN_TIMEOUT
         )
-        
-        if os.path.exists(output_path):
+
+        if os.path.exists(output_path) and os.path.getsize(output_path):
             with open(output_path, 'r') as f:
                 report = json.load(f)
             os.unlink(output_path)
-            
-            categories = report.get("categories", {})
-            return {
-                "url": url,
-                "scores": {
-                    "performance": int(categories.get("performance", {}).get("score", 0) * 100),
-                    "accessibility": int(categories.get("accessibility", {}).get("score", 0) * 100),
-                    "best_practices": int(categories.get("best-practices", {}).get("score", 0) * 100),
-                    "seo": int(categories.get("seo", {}).get("score", 0) * 100)
-                },
-                "summary": get_summary(categories)
-            }
-        else:
-            return {"error": "Lighthouse failed to generate report", "stderr": result.stderr[:500]}
-            
+            return report
+        if os.path.exists(output_path):
+            os.unlink(output_path)
+        return {"error": "Lighthouse failed to generate report", "stderr": result.stderr[:500]}
+
     except subprocess.TimeoutExpired:
         return {"error": "Lighthouse audit timed out"}
     except FileNotFoundError:
         return {"error": "Lighthouse CLI not found. Install with: npm install -g lighthouse"}
+    except ValueError:
+        return {"error": "Lighthouse wrote an unreadable report"}
+
+
+def extract_sample(report: dict) -> Dict[str, Optional[float]]:
+    """Category scores (0-100) and metric values of one run."""
+    categories = report.get("categories", {})
+    audits = report.get("audits", {})
+    sample = {}
+    for name, key in CATEGORIES.items():
+        score = categories.get(key, {}).get("score")
+        sample[name] = score * 100 if score is not None else None
+    for name, audit_id in METRICS.items():
+        sample[name] = audits.get(audit_id, {}).get("numericValue")
+    return sample
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = max(1, -(-len(ordered) * pct // 100))    # ceil
+    return ordered[int(rank) - 1]
+
+
+def summarize(samples: List[Dict[str, Optional[float]]]) -> Dict[str, dict]:
+    """median / p90 / min / max per score and metric over all runs."""
+    stats = {}
+    for name in list(CATEGORIES) + list(METRICS):
+        values = [s[name] for s in samples if s.get(name) is not None]
+        if not values:
+            stats[name] = None
+            continue
+        stats[name] = {
+            "median": round(statistics.median(values), 4),
+            "p90": round(percentile(values, 90), 4),
+            "min": round(min(values), 4),
+            "max": round(max(values), 4),
+            "values": [round(v, 4) for v in values],
+        }
+    return stats
 
-def get_summary(categories: dict) -> str:
-    """Generate summary based on scores."""
-    perf = categories.get("performance", {}).get("score", 0) * 100
+
+def run_lighthouse(url: str, runs: int = 1, preset: str = DEFAULT_PRESET) -> dict:
+    """Run Lighthouse audit on URL `runs` times; scores are medians across runs."""
+    samples = []
+    errors = []
+    for _ in range(max(1, runs)):
+        report = lighthouse_report(url, preset)
+        if "error" in report:
+            errors.append(report)
+            # A missing CLI or a dead URL won't fix itself on the next run
+            if not samples:
+                break
+            continue
+        samples.append(extract_sample(report))
+
+    if not samples:
+        return errors[0]
+
+    stats = summarize(samples)
+    scores = {name: int(stats[name]["median"]) if stats[name] else 0 for name in CATEGORIES}
+    result = {
+        "url": url,
+        "preset": preset,
+        "runs": len(samples),
+        "scores": scores,
+        "metrics": {name: stats[name] for name in METRICS},
+        "score_stats": {name: stats[name] for name in CATEGORIES},
+        "summary": get_summary(scores["performance"])
+    }
+    if errors:
+        result["failed_runs"] = len(errors)
+    return result
+
+
+def get_summary(perf: float) -> str:
+    """Generate summary based on the performance score."""
     if perf >= 90:
         return "[OK] Excellent performance"
     elif perf >= 50:
@@ -67,10 +210,349 @@ def get_summary(categories: dict) -> str:
     else:
         return "[X] Poor performance"
 
-if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(json.dumps({"error": "Usage: python lighthouse_audit.py <url>"}))
-        sys.exit(1)
-    
-    result = run_lighthouse(sys.argv[1])
+
+def git_commit(cwd: Optional[str] = None) -> Optional[str]:
+    try:
+        result = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                                cwd=cwd or None, timeout=10)
+    except (OSError, subprocess.TimeoutExpired):
+        return None
+    return result.stdout.strip() or None
+
+
+def compare(current: dict, baseline: dict, threshold: float) -> List[dict]:
+    """Medians that got worse than the baseline entry by more than threshold percent."""
+    regressions = []
+    for name in list(METRICS) + list(CATEGORIES):
+        now = (current.get(name) or {}).get("median")
+        before = (baseline.get(name) or {}).get("median")
+        if now is None or before is None:
+            continue
+        higher_is_better = name in CATEGORIES
+        worse = before - now if higher_is_better else now - before
+        if worse <= 0:
+            continue
+        # CLS and TBT are often 0 at baseline; fall back to an absolute floor there
+        change = worse / before * 100 if before else float("inf")
+        if change > threshold and (before or worse > (0.01 if name == "cls" else 10)):
+            regressions.append({"metric": name, "baseline": before, "current": now,
+                                "change_pct": round(change, 1) if before else None})
+    return regressions
+
+
+def history_target(url: str, served: bool = False) -> str:
+    """History key for a URL: the URL itself, or "served:<path>" for --serve (its port changes every run)."""
+    if not served:
+        return url
+    parts = urllib.parse.urlsplit(url)
+    return "served:" + urllib.parse.urlunsplit(("", "", parts.path or "/", parts.query, ""))
+
+
+def record_history(path: str, result: dict, threshold: float, cwd: Optional[str] = None,
+                   target: Optional[str] = None) -> dict:
+    """
+    Append this audit to the history file and compare it with the last one for the same target/preset.
+    target defaults to the URL (see history_target).
+    """
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+        if not isinstance(history, list):
+            history = []
+    except (OSError, ValueError):
+        history = []
+
+    stats = dict(result["metrics"], **result["score_stats"])
+    target = target or result["url"]
+    baseline = next((h for h in reversed(history)
+                     if h.get("target", h.get("url")) == target and h.get("preset") == result["preset"]), None)
+    entry = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "commit": git_commit(cwd),
+        "target": target,
+        "url": result["url"],
+        "preset": result["preset"],
+        "runs": result["runs"],
+        "stats": {name: {"median": s["median"], "p90": s["p90"]} if s else None for name, s in stats.items()},
+    }
+    history.append(entry)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(history, f, indent=2)
+
+    comparison = {"baseline_commit": None, "threshold_pct": threshold, "regressions": []}
+    if baseline:
+        comparison["baseline_commit"] = baseline.get("commit")
+        comparison["regressions"] = compare(entry["stats"], baseline.get("stats", {}), threshold)
+    return comparison
+
+
+def _tag_end(text: str, start: int) -> Tuple[int, bool]:
+    """Offset just past the '>' closing the JSX tag opened before start, and whether it self-closes."""
+    depth, quote = 0, None
+    for i in range(start, len(text)):
+        c = text[i]
+        if quote:
+            if c == quote:
+                quote = None
+        elif c in "\"'" and depth == 0:
+            quote = c
+        elif c == "{":
+            depth += 1
+        elif c == "}":
+            depth -= 1
+        elif c == ">" and depth == 0:
+            return i + 1, text[i - 1] == "/"
+    return len(text), True
+
+
+def router_paths(text: str) -> List[str]:
+    """Route paths declared in one source file (JSX <Route> nesting resolved, object routes absolute only)."""
+    paths = []
+    stack = []      # full path of each open <Route>, None for pathless layout routes
+    pos = 0
+    while True:
+        match = _ROUTE_TAG_RE.search(text, pos)
+        if not match:
+            break
+        if match.group().startswith("</"):
+            if stack:
+                stack.pop()
+            pos = match.end()
+            continue
+        end, self_closing = _tag_end(text, match.end())
+        parent = next((p for p in reversed(stack) if p is not None), "/")
+        attr = _PATH_ATTR_RE.search(text, match.end(), end)
+        full = None
+        if attr:
+            path = attr.group(1) if attr.group(1) is not None else attr.group(2)
+            full = path if path.startswith("/") else posixpath.join(parent, path)
+            paths.append(full)
+        elif _INDEX_ATTR_RE.search(text, match.end(), end):
+            paths.append(parent)
+        if not self_closing:
+            stack.append(full)
+        pos = end
+    paths += _OBJECT_PATH_RE.findall(text)
+    return paths
+
+
+def discover_routes(project_path: str) -> List[str]:
+    """Paths from the React Router config and any sitemap.xml in the project."""
+    found = []
+    graph = module_graph(project_path, skip_dirs=SKIP_DIRS)
+    for module in graph.modules_with():
+        if any(site.spec.startswith("react-router") for site in module.imports):
+            found += router_paths(module.text)
+    for name in SITEMAPS:
+        try:
+            xml = (Path(project_path) / name).read_text(encoding="utf-8", errors="ignore")
+        except OSError:
+            continue
+        found += [urllib.parse.urlparse(loc).path or "/" for loc in _LOC_RE.findall(xml)]
+    return found
+
+
+def expand_routes(routes: List[str], params: Dict[str, str]) -> Tuple[List[str], List[str]]:
+    """(auditable routes, skipped routes): params filled in, splats and unknown params skipped, deduplicated."""
+    ready, skipped = [], []
+    for route in routes:
+        route = "/" + route.strip().lstrip("/")
+        if "*" in route or any(name not in params for name in _PARAM_RE.findall(route)):
+            if route not in skipped:
+                skipped.append(route)
+            continue
+        route = _PARAM_RE.sub(lambda m: urllib.parse.quote(params[m.group(1)]), route)
+        if route not in ready:
+            ready.append(route)
+    return ready, skipped
+
+
+class _SPAHandler(http.server.SimpleHTTPRequestHandler):
+    """Static files from the build, index.html for client-side routes."""
+
+    def send_head(self):
+        path = urllib.parse.urlparse(self.path).path
+        if not os.path.exists(self.translate_path(self.path)) and not posixpath.splitext(path)[1]:
+            self.path = "/index.html"
+        return super().send_head()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_build(directory: Path) -> Tuple[http.server.ThreadingHTTPServer, str]:
+    """Serve directory on a free local port in a background thread; returns (server, base_url)."""
+    handler = functools.partial(_SPAHandler, directory=str(directory))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def audit_routes(base_url: str, routes: List[str], runs: int = 1, preset: str = DEFAULT_PRESET,
+                 concurrency: int = DEFAULT_CONCURRENCY) -> List[dict]:
+    """run_lighthouse for every route, at most `concurrency` at a time; results in route order."""
+    base = base_url.rstrip("/")
+
+    def audit(route: str) -> dict:
+        return dict(run_lighthouse(base + route, runs, preset), route=route)
+
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as pool:
+        return list(pool.map(audit, routes))
+
+
+def route_matrix(results: List[dict]) -> List[dict]:
+    """One row per route: performance score and metric medians (or the error)."""
+    rows = []
+    for result in results:
+        row = {"route": result["route"]}
+        if "error" in result:
+            row["error"] = result["error"]
+        else:
+            row["performance"] = result["scores"]["performance"]
+            for name in METRICS:
+                stat = result["metrics"].get(name)
+                row[name] = stat["median"] if stat else None
+        rows.append(row)
+    return rows
+
+
+def print_matrix(rows: List[dict]) -> None:
+    width = max([len("route")] + [len(r["route"]) for r in rows])
+    header = f"{'route':<{width}}  {'perf':>4}  {'LCP':>7}  {'TBT':>6}  {'CLS':>5}  {'FCP':>7}  {'SI':>7}  {'TTI':>7}"
+    print(header)
+    print("-" * len(header))
+    for row in rows:
+        if "error" in row:
+            print(f"{row['route']:<{width}}  [X] {row['error']}")
+            continue
+
+        def ms(name):
+            return "-" if row[name] is None else f"{row[name]:.0f}"
+
+        cls = "-" if row["cls"] is None else f"{row['cls']:.3f}"
+        print(f"{row['route']:<{width}}  {row['performance']:>4}  {ms('lcp'):>7}  {ms('tbt'):>6}  {cls:>5}  "
+              f"{ms('fcp'):>7}  {ms('speed_index'):>7}  {ms('tti'):>7}")
+
+
+def _routes_arg(value: str) -> List[str]:
+    if value.startswith("@"):
+        try:
+            with open(value[1:], "r", encoding="utf-8") as f:
+                return [line.strip() for line in f if line.strip() and not line.startswith("#")]
+        except (OSError, UnicodeDecodeError) as e:
+            # argparse only turns ValueError/TypeError into a usage error by itself
+            raise argparse.ArgumentTypeError(f"cannot read routes file {value[1:]}: {e}")
+    return [r for r in value.split(",") if r.strip()]
+
+
+def _params_arg(values: List[str]) -> Dict[str, str]:
+    params = {}
+    for value in values or []:
+        name, sep, param = value.partition("=")
+        if not sep:
+            raise ValueError(f"--param expects NAME=VALUE, got '{value}'")
+        params[name] = param
+    return params
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run Lighthouse performance audit on a URL")
+    parser.add_argument("targets", nargs="*", metavar="[project_path] url",
+                        help="URL to audit, or the base URL for --routes/--discover "
+                             "(a leading project path, as passed by verify_all, is accepted)")
+    parser.add_argument("--runs", "-n", type=int, default=1, help="Audit the URL N times and report median/p90")
+    parser.add_argument("--preset", choices=sorted(PRESETS), default=DEFAULT_PRESET,
+                        help=f"Throttling preset (default: {DEFAULT_PRESET}, i.e. slow 4G)")
+    parser.add_argument("--history", metavar="FILE", help="Append results to this JSON history and compare")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help=f"Percent a median may worsen before it is a regression (default: {DEFAULT_THRESHOLD})")
+    parser.add_argument("--routes", type=_routes_arg, default=[],
+                        help="Comma-separated paths to audit under the base URL, or @file with one per line")
+    parser.add_argument("--discover", action="store_true",
+                        help="Add routes from the React Router config and sitemap.xml")
+    parser.add_argument("--param", action="append", metavar="NAME=VALUE",
+                        help="Value for a dynamic route segment (e.g. slug=my-post)")
+    parser.add_argument("--serve", nargs="?", const="dist", metavar="DIR",
+                        help="Serve the build (default: dist) locally and audit it")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY,
+                        help=f"Lighthouse processes at once in multi-route mode (default: {DEFAULT_CONCURRENCY})")
+    parser.add_argument("--table", action="store_true", help="Print the per-route matrix instead of JSON")
+    args = parser.parse_args()
+
+    urls = [t for t in args.targets if re.match(r"https?://", t)]
+    others = [t for t in args.targets if t not in urls]
+    project_path = others[0] if others else None
+    try:
+        params = _params_arg(args.param)
+    except ValueError as e:
+        parser.error(str(e))
+
+    server = None
+    if args.serve:
+        build = Path(project_path or ".") / args.serve
+        if not (build / "index.html").is_file():
+            print(json.dumps({"error": f"No build to serve at {build} (run npm run build)"}))
+            sys.exit(1)
+        server, url = serve_build(build)
+    elif urls:
+        url = urls[-1]
+    else:
+        parser.error("a URL is required unless --serve is used")
+
+    try:
+        if args.routes or args.discover:
+            routes = list(args.routes)
+            if args.discover:
+                routes += discover_routes(project_path or ".")
+            routes, skipped = expand_routes(routes, params)
+            sys.exit(report_routes(url, routes, skipped, args, project_path, served=bool(server)))
+
+        result = run_lighthouse(url, args.runs, args.preset)
+    finally:
+        if server:
+            server.shutdown()
+    if "error" not in result and args.history:
+        result["history"] = record_history(args.history, result, args.threshold, project_path,
+                                           history_target(url, bool(server)))
     print(json.dumps(result, indent=2))
+
+    if result.get("history", {}).get("regressions"):
+        sys.exit(1)
+
+
+def report_routes(base_url: str, routes: List[str], skipped: List[str], args, project_path,
+                  served: bool = False) -> int:
+    """Audit every route, print the matrix (or JSON) and return the exit code."""
+    results = audit_routes(base_url, routes, args.runs, args.preset, args.concurrency)
+    regressions = False
+    if args.history:
+        for result in results:
+            if "error" not in result:
+                result["history"] = record_history(args.history, result, args.threshold, project_path,
+                                                   history_target(result["url"], served))
+                regressions = regressions or bool(result["history"]["regressions"])
+    rows = route_matrix(results)
+
+    if args.table:
+        print(f"Lighthouse ({args.preset}, {args.runs} run(s), median) - {base_url}\n")
+        print_matrix(rows)
+        if skipped:
+            print(f"\nSkipped (needs --param or is a splat): {', '.join(skipped)}")
+        for result in results:
+            for reg in result.get("history", {}).get("regressions", []):
+                print(f"[X] {result['route']}: {reg['metric']} {reg['baseline']} -> {reg['current']}")
+    else:
+        print(json.dumps({
+            "base_url": base_url,
+            "preset": args.preset,
+            "runs": args.runs,
+            "concurrency": args.concurrency,
+            "matrix": rows,
+            "skipped_routes": skipped,
+            "routes": results,
+        }, indent=2))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    main()
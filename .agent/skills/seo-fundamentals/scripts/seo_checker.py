@@ -23,6 +23,12 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared audit helpers (.agent/.shared/audit-kit)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from content_cache import read_text
+from file_index import project_files
+from result_cache import FileResultCache, script_fingerprint
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -77,18 +83,15 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_pages(project_path: Path) -> list:
     """Find page files to check."""
-    patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
+    suffixes = ['.html', '.htm', '.jsx', '.tsx']
+    entries = project_files(project_path, suffixes=suffixes, skip_dirs=SKIP_DIRS)
     
     files = []
-    for pattern in patterns:
-        for f in project_path.glob(pattern):
-            # Skip excluded directories
-            if any(skip in f.parts for skip in SKIP_DIRS):
-                continue
-            
+    for suffix in suffixes:
+        for entry in entries:
             # Check if it's likely a page
-            if is_page_file(f):
-                files.append(f)
+            if entry.suffix == suffix and is_page_file(entry.path):
+                files.append(entry.path)
     
     return files[:50]  # Limit to 50 files
 
@@ -98,7 +101,7 @@ def check_page(file_path: Path) -> dict:
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = read_text(file_path)
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
@@ -145,8 +148,9 @@ def check_page(file_path: Path) -> dict:
     }
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+def run_check(project_path) -> dict:
+    """Audit every public page; prints the report and returns the JSON summary."""
+    project_path = Path(project_path).resolve()
     
     print(f"\n{'='*60}")
     print(f"  SEO CHECKER - Search Engine Optimization Audit")
@@ -163,16 +167,18 @@ def main():
         print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
         output = {"script": "seo_checker", "files_checked": 0, "passed": True}
         print("\n" + json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
     print(f"Found {len(pages)} page files to analyze\n")
     
-    # Check each page
+    # Check each page (unchanged files are served from the verify cache)
+    cache = FileResultCache("seo_checker", project_path, salt=script_fingerprint(__file__))
     all_issues = []
     for f in pages:
-        result = check_page(f)
+        result = cache.get_or_compute(f, lambda: check_page(f))
         if result["issues"]:
             all_issues.append(result)
+    cache.save()
     
     # Summary
     print("=" * 60)
@@ -212,7 +218,12 @@ def main():
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    return output
+
+def main():
+    project_path = sys.argv[1] if len(sys.argv) > 1 else "."
+    result = run_check(project_path)
+    sys.exit(0 if result["passed"] else 1)
 
 
 if __name__ == "__main__":
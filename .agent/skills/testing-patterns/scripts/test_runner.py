@@ -137,9 +137,9 @@ def run_tests(cmd: list, cwd: Path) -> dict:
     return result
 
 
-def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
-    with_coverage = "--coverage" in sys.argv
+def run_check(project_path, with_coverage: bool = False) -> dict:
+    """Run the project's test suite; prints the report and returns the JSON summary."""
+    project_path = Path(project_path).resolve()
     
     print(f"\n{'='*60}")
     print(f"[TEST RUNNER] Unified Test Execution")
@@ -165,7 +165,7 @@ def main():
             "message": "No tests configured"
         }
         print(json.dumps(output, indent=2))
-        sys.exit(0)
+        return output
     
     # Choose command
     cmd = test_info["coverage_cmd"] if with_coverage and test_info["coverage_cmd"] else test_info["cmd"]
@@ -212,6 +212,12 @@ def main():
     
     print("\n" + json.dumps(output, indent=2))
     
+    return output
+
+
+def main():
+    project_path = sys.argv[1] if len(sys.argv) > 1 else "."
+    result = run_check(project_path, with_coverage="--coverage" in sys.argv)
     sys.exit(0 if result["passed"] else 1)
 
 
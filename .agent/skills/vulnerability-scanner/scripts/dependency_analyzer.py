@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""
+Skill: vulnerability-scanner
+Script: dependency_analyzer.py
+Purpose: Offline dependency weight and duplication analysis from package-lock.json
+Usage: python dependency_analyzer.py <project_path> [--output json|summary] [--top N]
+Output: JSON with duplicate versions, transitive counts and installed size per
+        top-level dependency, and server-only packages in a client app
+
+Nothing is fetched: the dependency tree comes from package-lock.json /
+npm-shrinkwrap.json (lockfile v1-v3) and sizes from node_modules when it is
+installed. Transitive counts resolve each package's dependencies the way
+Node does (nearest node_modules first). "exclusive" counts/sizes are the
+packages only that top-level dependency pulls in - what removing it saves.
+"""
+import argparse
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Shared audit helpers (.agent/.shared/audit-kit)
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / ".shared" / "audit-kit"))
+from module_graph import module_graph
+
+# Fix Windows console encoding for Unicode output
+try:
+    sys.stdout.reconfigure(encoding='utf-8', errors='replace')
+    sys.stderr.reconfigure(encoding='utf-8', errors='replace')
+except AttributeError:
+    pass  # Python < 3.7
+
+
+# ============================================================================
+#  CONFIGURATION
+# ============================================================================
+
+LOCK_FILES = ["package-lock.json", "npm-shrinkwrap.json"]
+
+# Packages that only make sense on a Node server
+SERVER_ONLY_PACKAGES = {
+    "express", "multer", "cors", "body-parser", "cookie-parser", "express-session",
+    "helmet", "morgan", "koa", "fastify", "nodemailer", "pg", "mysql2", "mongoose",
+    "sqlite3", "better-sqlite3", "bcrypt",
+}
+# Build tools marking a client-only (browser) app, and frameworks that also run server code
+CLIENT_BUILD_TOOLS = {"vite", "react-scripts", "parcel", "@vitejs/plugin-react", "@vitejs/plugin-react-swc"}
+FULLSTACK_FRAMEWORKS = {"next", "nuxt", "@remix-run/node", "@sveltejs/kit", "astro"}
+
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next'}
+DEFAULT_TOP = 10
+
+
+# ============================================================================
+#  LOCKFILE
+# ============================================================================
+
+def _version_key(version: str) -> tuple:
+    """Numeric sort key for dotted versions ('10.0.0' after '9.1.0')."""
+    release = version.split("-")[0].split("+")[0]
+    return tuple(int(p) if p.isdigit() else 0 for p in release.split(".")), version
+
+
+def _package_name(path: str) -> str:
+    """'node_modules/a/node_modules/@s/b' -> '@s/b'."""
+    return path.rsplit("node_modules/", 1)[-1]
+
+
+def _flatten_v1(dependencies: Dict[str, dict], prefix: str, packages: Dict[str, dict]) -> None:
+    """Lockfile v1 nested 'dependencies' tree to v2-style 'packages' entries."""
+    for name, info in dependencies.items():
+        path = f"{prefix}node_modules/{name}"
+        packages[path] = {
+            "version": info.get("version", ""),
+            "dev": info.get("dev", False),
+            "optional": info.get("optional", False),
+            "dependencies": info.get("requires", {}),
+        }
+        _flatten_v1(info.get("dependencies", {}), path + "/", packages)
+
+
+def load_lockfile(project_path: Path) -> Optional[Dict[str, Any]]:
+    """{'file', 'root', 'packages'} with v2-style package paths, or None without an npm lockfile."""
+    for name in LOCK_FILES:
+        try:
+            lock = json.loads((project_path / name).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            continue
+        packages = dict(lock.get("packages", {}))
+        if not packages:
+            _flatten_v1(lock.get("dependencies", {}), "", packages)
+            try:
+                manifest = json.loads((project_path / "package.json").read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                manifest = {}
+            packages[""] = manifest
+        root = packages.pop("", {})
+        # Workspace links point at another entry; keep only real installs
+        packages = {path: info for path, info in packages.items()
+                    if "node_modules/" in path and not info.get("link")}
+        return {"file": name, "root": root, "packages": packages}
+    return None
+
+
+def _resolve(packages: Dict[str, dict], from_path: str, name: str) -> Optional[str]:
+    """Path Node would load `name` from when required inside from_path."""
+    base = from_path
+    while True:
+        candidate = f"{base}/node_modules/{name}" if base else f"node_modules/{name}"
+        if candidate in packages:
+            return candidate
+        if not base:
+            return None
+        idx = base.rfind("/node_modules/")
+        base = base[:idx] if idx != -1 else ""
+
+
+def _edges(info: dict) -> List[str]:
+    names = list(info.get("dependencies", {}))
+    names += [n for n in info.get("optionalDependencies", {}) if n not in names]
+    names += [n for n in info.get("peerDependencies", {}) if n not in names]
+    return names
+
+
+def _closure(packages: Dict[str, dict], start: str) -> set:
+    """Every package path reachable from start (included)."""
+    seen = {start}
+    stack = [start]
+    while stack:
+        path = stack.pop()
+        for name in _edges(packages[path]):
+            target = _resolve(packages, path, name)
+            if target and target not in seen:
+                seen.add(target)
+                stack.append(target)
+    return seen
+
+
+# ============================================================================
+#  INSTALLED SIZES
+# ============================================================================
+
+def installed_sizes(project_path: Path, packages: Dict[str, dict]) -> Optional[Dict[str, int]]:
+    """Bytes on disk per package path (nested node_modules excluded), None without node_modules."""
+    if not (project_path / "node_modules").is_dir():
+        return None
+    sizes = {}
+    for path in packages:
+        root = project_path / path
+        if not root.is_dir() or root.is_symlink():
+            continue
+        total = 0
+        for dirpath, dirnames, filenames in os.walk(root):
+            dirnames[:] = [d for d in dirnames if d != "node_modules"]
+            for filename in filenames:
+                try:
+                    total += os.lstat(os.path.join(dirpath, filename)).st_size
+                except OSError:
+                    continue
+        sizes[path] = total
+    return sizes
+
+
+# ============================================================================
+#  ANALYSIS
+# ============================================================================
+
+def find_duplicates(packages: Dict[str, dict]) -> List[Dict[str, Any]]:
+    """Packages installed in more than one version."""
+    versions = {}
+    for path, info in packages.items():
+        versions.setdefault(_package_name(path), {}).setdefault(info.get("version", "?"), []).append(path)
+    duplicates = []
+    for name, by_version in versions.items():
+        if len(by_version) > 1:
+            duplicates.append({
+                "package": name,
+                "versions": sorted(by_version, key=_version_key),
+                "copies": sum(len(paths) for paths in by_version.values()),
+                "paths": {version: sorted(by_version[version]) for version in sorted(by_version, key=_version_key)},
+                "dev_only": all(packages[p].get("dev") for paths in by_version.values() for p in paths),
+            })
+    return sorted(duplicates, key=lambda d: (-d["copies"], d["package"]))
+
+
+def analyze_top_level(root: dict, packages: Dict[str, dict],
+                      sizes: Optional[Dict[str, int]]) -> List[Dict[str, Any]]:
+    """Transitive count and installed size (total and exclusive) per direct dependency."""
+    direct = []
+    for section, dev in (("dependencies", False), ("devDependencies", True), ("optionalDependencies", False)):
+        for name, spec in root.get(section, {}).items():
+            if not any(d["name"] == name for d in direct):
+                direct.append({"name": name, "spec": spec, "dev": dev})
+
+    closures = {}
+    for dep in direct:
+        path = _resolve(packages, "", dep["name"])
+        closures[dep["name"]] = _closure(packages, path) if path else set()
+
+    owners = {}
+    for name, closure in closures.items():
+        for path in closure:
+            owners[path] = owners.get(path, 0) + 1
+
+    results = []
+    for dep in direct:
+        closure = closures[dep["name"]]
+        path = _resolve(packages, "", dep["name"])
+        exclusive = {p for p in closure if owners[p] == 1}
+        entry = {
+            "package": dep["name"],
+            "spec": dep["spec"],
+            "version": packages[path].get("version") if path else None,
+            "dev": dep["dev"],
+            "installed": path is not None,
+            "transitive": max(len(closure) - 1, 0),
+            "exclusive": max(len(exclusive) - 1, 0),
+            "size": None,
+            "exclusive_size": None,
+        }
+        if sizes is not None:
+            entry["size"] = sum(sizes.get(p, 0) for p in closure)
+            entry["exclusive_size"] = sum(sizes.get(p, 0) for p in exclusive)
+        results.append(entry)
+    key = (lambda r: -(r["size"] or 0)) if sizes is not None else (lambda r: -r["transitive"])
+    return sorted(results, key=key)
+
+
+def find_server_only(project_path: Path, root: dict) -> List[Dict[str, Any]]:
+    """Server-only packages listed in `dependencies` of a client-only (bundled) app."""
+    declared = set(root.get("dependencies", {})) | set(root.get("devDependencies", {}))
+    if not declared & CLIENT_BUILD_TOOLS or declared & FULLSTACK_FRAMEWORKS:
+        return []
+    flagged = sorted(SERVER_ONLY_PACKAGES & set(root.get("dependencies", {})))
+    if not flagged:
+        return []
+
+    graph = module_graph(project_path, skip_dirs=SKIP_DIRS)
+    used_by = {name: [] for name in flagged}
+    for module in graph.modules_with():
+        for site in module.imports:
+            for name in flagged:
+                if site.spec == name or site.spec.startswith(name + "/"):
+                    if module.rel not in used_by[name]:
+                        used_by[name].append(module.rel)
+    return [{
+        "package": name,
+        "used_by": used_by[name],
+        "message": (f"{name} is a server-only package in dependencies of a client app"
+                    + (f" (used by {', '.join(used_by[name])})" if used_by[name] else " (not imported anywhere)")
+                    + "; move the server into its own package or drop the dependency"),
+    } for name in flagged]
+
+
+def analyze(project_path: str) -> Dict[str, Any]:
+    path = Path(project_path)
+    report = {
+        "project": str(path),
+        "lockfile": None,
+        "packages": 0,
+        "node_modules": False,
+        "top_level": [],
+        "duplicates": [],
+        "server_only": [],
+    }
+    lock = load_lockfile(path)
+    if lock is None:
+        report["error"] = "No package-lock.json / npm-shrinkwrap.json found (run npm install)"
+        return report
+
+    packages = lock["packages"]
+    sizes = installed_sizes(path, packages)
+    report.update({
+        "lockfile": lock["file"],
+        "packages": len(packages),
+        "node_modules": sizes is not None,
+        "installed_size": sum(sizes.values()) if sizes is not None else None,
+        "top_level": analyze_top_level(lock["root"], packages, sizes),
+        "duplicates": find_duplicates(packages),
+        "server_only": find_server_only(path, lock["root"]),
+    })
+    return report
+
+
+# ============================================================================
+#  OUTPUT
+# ============================================================================
+
+def _size(value: Optional[int]) -> str:
+    if value is None:
+        return "-"
+    return f"{value / (1024 * 1024):.1f} MB" if value >= 1024 * 1024 else f"{value / 1024:.0f} KB"
+
+
+def print_summary(report: Dict[str, Any], top: int = DEFAULT_TOP) -> None:
+    print(f"\n{'='*60}")
+    print(f"Dependency Analysis: {report['project']}")
+    print(f"{'='*60}")
+    if report.get("error"):
+        print(f"[!] {report['error']}")
+        return
+    print(f"Lockfile: {report['lockfile']}  Packages: {report['packages']}  "
+          f"Installed: {_size(report['installed_size']) if report['node_modules'] else 'no node_modules (sizes unavailable)'}")
+
+    print(f"\nTOP-LEVEL DEPENDENCIES ({len(report['top_level'])}):")
+    for dep in report["top_level"][:top]:
+        kind = " [dev]" if dep["dev"] else ""
+        size = f"  size {_size(dep['size'])} (exclusive {_size(dep['exclusive_size'])})" if report["node_modules"] else ""
+        print(f"  - {dep['package']}@{dep['version'] or '?'}{kind}: {dep['transitive']} transitive "
+              f"({dep['exclusive']} exclusive){size}")
+
+    print(f"\nDUPLICATE VERSIONS ({len(report['duplicates'])}):")
+    for dup in report["duplicates"][:top]:
+        kind = " [dev]" if dup["dev_only"] else ""
+        print(f"  - {dup['package']}{kind}: {', '.join(dup['versions'])}")
+
+    if report["server_only"]:
+        print(f"\nSERVER-ONLY PACKAGES IN CLIENT DEPENDENCIES ({len(report['server_only'])}):")
+        for item in report["server_only"]:
+            print(f"  - {item['message']}")
+    print(f"{'='*60}\n")
+
+
+def run_check(project_path, output: str = "json", top: int = DEFAULT_TOP) -> Dict[str, Any]:
+    """Analyze and print; findings are informational, so a completed analysis passes."""
+    if not os.path.isdir(project_path):
+        print(json.dumps({"error": f"Directory not found: {project_path}"}))
+        return {"passed": False, "error": f"Directory not found: {project_path}"}
+
+    report = analyze(project_path)
+    if output == "summary":
+        print_summary(report, top)
+    else:
+        print(json.dumps(report, indent=2))
+    return dict(report, passed=True)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Offline dependency weight and duplication analysis (package-lock.json)"
+    )
+    parser.add_argument("project_path", nargs="?", default=".", help="Project directory to analyze")
+    parser.add_argument("--output", choices=["json", "summary"], default="json", help="Output format")
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP, help="Entries per section in the summary")
+
+    args = parser.parse_args()
+    result = run_check(args.project_path, args.output, args.top)
+    sys.exit(0 if result["passed"] else 1)
+
+
+if __name__ == "__main__":
+    main()